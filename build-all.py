@@ -6,13 +6,60 @@ Builds executables for macOS, Windows, and Linux
 
 import sys
 import os
+import json
 import shutil
+import hashlib
+import sysconfig
 import subprocess
 import argparse
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
+# ioctl request number for FICLONE (Linux, Btrfs/XFS reflinks)
+FICLONE = 0x40049409
+
+# Container images used to build targets that aren't the host platform.
+# Override with MURMUR_BUILD_IMAGE_<TARGET>, e.g. a Wine-based PyInstaller
+# image for Windows. macOS has no container image and still needs a Mac.
+CONTAINER_IMAGES = {
+    'Linux': 'python:3.11',
+}
+
+
+def _reflink_copy(src, dst):
+    """Copy a file as a copy-on-write clone when the filesystem supports it"""
+    try:
+        if sys.platform == 'darwin':
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return dst
+        elif sys.platform.startswith('linux'):
+            import fcntl
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+    except (OSError, AttributeError):
+        pass
+
+    # Different filesystems or no CoW support: regular copy
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    return shutil.copy2(src, dst)
+
+
+# build-all.py flag for each target platform
+TARGET_FLAGS = {
+    'Darwin': 'macos',
+    'Windows': 'windows',
+    'Linux': 'linux',
+}
+
+
 class Colors:
     """ANSI color codes for terminal output"""
     BLUE = '\033[94m'
@@ -26,13 +73,17 @@ class Colors:
 class BuildSystem:
     """Main build orchestration system"""
 
-    def __init__(self):
+    def __init__(self, force=False, skip_frontend=False):
+        self.force = force
+        self.skip_frontend = skip_frontend
         self.root_dir = Path(__file__).parent.absolute()
         self.build_dir = self.root_dir / 'build'
         self.dist_dir = self.root_dir / 'dist'
         self.server_dir = self.root_dir / 'server'
         self.scripts_dir = self.root_dir / 'scripts'
         self.platform = platform.system()
+        self.dep_cache_file = self.build_dir / '.dep-cache.json'
+        self._stat_cache = {}
 
     def print_step(self, message):
         """Print a build step message"""
@@ -50,27 +101,141 @@ class BuildSystem:
         """Print a warning message"""
         print(f"{Colors.YELLOW}⚠ {message}{Colors.END}")
 
-    def run_command(self, command, cwd=None, shell=False):
-        """Run a shell command and return success status"""
+    def _stat(self, path):
+        """Return os.stat for path (None if missing), cached for this build"""
+        key = str(path)
+        try:
+            return self._stat_cache[key]
+        except KeyError:
+            pass
+
+        try:
+            result = os.stat(key)
+        except FileNotFoundError:
+            result = None
+        self._stat_cache[key] = result
+        return result
+
+    def _exists(self, path):
+        """Cached equivalent of Path.exists()"""
+        return self._stat(path) is not None
+
+    def _drain(self, stream, prefix, log_path):
+        """Copy a child's output line by line to stdout and its log file"""
+        with open(log_path, 'a', encoding='utf-8', errors='replace') as log:
+            for line in stream:
+                log.write(line)
+                sys.stdout.write(f"[{prefix}] {line}")
+                sys.stdout.flush()
+        stream.close()
+
+    def run_command(self, command, cwd=None, shell=False, env=None, prefix=None):
+        """Run a shell command and return success status
+
+        Output is piped through a drain thread that prefixes each line and
+        appends it to build/logs/<prefix>.log, so concurrent commands don't
+        interleave unreadably on the terminal.
+        """
         try:
             if isinstance(command, str) and not shell:
                 command = command.split()
 
-            result = subprocess.run(
+            if prefix is None:
+                first = command[0] if isinstance(command, list) else command.split()[0]
+                prefix = Path(first).stem
+
+            log_dir = self.build_dir / 'logs'
+            log_dir.mkdir(parents=True, exist_ok=True)
+
+            process = subprocess.Popen(
                 command,
                 cwd=cwd or self.root_dir,
-                check=True,
                 shell=shell,
-                capture_output=False
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True
             )
-            return result.returncode == 0
-        except subprocess.CalledProcessError as e:
-            self.print_error(f"Command failed with exit code {e.returncode}")
-            return False
+            drainer = threading.Thread(
+                target=self._drain,
+                args=(process.stdout, prefix, log_dir / f"{prefix}.log"),
+                daemon=True
+            )
+            drainer.start()
+
+            returncode = process.wait()
+            drainer.join()
+
+            # The child may have created or replaced files we already stat'ed
+            self._stat_cache.clear()
+
+            if returncode != 0:
+                self.print_error(f"Command failed with exit code {returncode}")
+                return False
+            return True
         except FileNotFoundError:
             self.print_error(f"Command not found: {command[0] if isinstance(command, list) else command}")
             return False
 
+    def _copy_if_changed(self, src, dst):
+        """Copy src to dst unless dst already matches its size and mtime"""
+        src_stat = os.stat(src)
+        try:
+            dst_stat = os.lstat(dst)
+            if (dst_stat.st_size == src_stat.st_size
+                    and dst_stat.st_mtime >= src_stat.st_mtime):
+                return
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+        _reflink_copy(src, dst)
+
+    def sync_tree(self, src, dst):
+        """Mirror src into dst, copying only files that changed and removing stale ones"""
+        for dirpath, dirnames, filenames in os.walk(src):
+            target_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+            os.makedirs(target_dir, exist_ok=True)
+
+            # Drop entries that no longer exist in the source tree
+            expected = set(dirnames) | set(filenames)
+            for entry in os.scandir(target_dir):
+                if entry.name not in expected:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+
+            # Recreate symlinks (app bundles use them for frameworks)
+            for name in list(dirnames) + filenames:
+                src_path = os.path.join(dirpath, name)
+                if not os.path.islink(src_path):
+                    continue
+                if name in dirnames:
+                    dirnames.remove(name)
+                else:
+                    filenames.remove(name)
+                dst_path = os.path.join(target_dir, name)
+                link_target = os.readlink(src_path)
+                if os.path.islink(dst_path) and os.readlink(dst_path) == link_target:
+                    continue
+                if os.path.isdir(dst_path) and not os.path.islink(dst_path):
+                    shutil.rmtree(dst_path)
+                elif os.path.lexists(dst_path):
+                    os.unlink(dst_path)
+                os.symlink(link_target, dst_path)
+
+            for name in dirnames:
+                dst_path = os.path.join(target_dir, name)
+                if os.path.lexists(dst_path) and not os.path.isdir(dst_path):
+                    os.unlink(dst_path)
+
+            for name in filenames:
+                dst_path = os.path.join(target_dir, name)
+                if os.path.isdir(dst_path) and not os.path.islink(dst_path):
+                    shutil.rmtree(dst_path)
+                self._copy_if_changed(os.path.join(dirpath, name), dst_path)
+
     def clean_build(self):
         """Clean previous build artifacts"""
         self.print_step("Cleaning previous build artifacts...")
@@ -83,16 +248,67 @@ class BuildSystem:
         ]
 
         for dir_path in dirs_to_clean:
-            if dir_path.exists():
+            if self._exists(dir_path):
                 shutil.rmtree(dir_path)
+                self._stat_cache.pop(str(dir_path), None)
                 self.print_success(f"Removed {dir_path.name}/")
 
-        # Clean .pyc files
-        for pyc_file in self.root_dir.rglob('*.pyc'):
-            pyc_file.unlink()
+        # Clean bytecode. It only lives under server/ and scripts/, so walk
+        # those trees instead of the whole repo (node_modules, .git, dist).
+        for source_dir in (self.server_dir, self.scripts_dir):
+            for dirpath, dirnames, filenames in os.walk(source_dir):
+                if '__pycache__' in dirnames:
+                    # Remove the whole cache dir once and don't descend into it
+                    dirnames.remove('__pycache__')
+                    shutil.rmtree(os.path.join(dirpath, '__pycache__'), ignore_errors=True)
+                for filename in filenames:
+                    if filename.endswith('.pyc'):
+                        os.unlink(os.path.join(dirpath, filename))
 
         self.print_success("Build artifacts cleaned")
 
+    def _load_dep_cache(self):
+        """Load cached dependency lookups, discarding them if PATH changed"""
+        key = hashlib.sha256(f"{os.environ.get('PATH', '')}|{sys.executable}".encode()).hexdigest()
+        try:
+            with open(self.dep_cache_file) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+        if cache.get('key') != key:
+            cache = {'key': key, 'tools': {}}
+        return cache
+
+    def _save_dep_cache(self, cache):
+        """Persist dependency lookups for the next build"""
+        try:
+            self.build_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.dep_cache_file, 'w') as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            self.print_warning(f"Could not write dependency cache: {e}")
+
+    def _find_pyinstaller(self, cache):
+        """Return the PyInstaller version, importing it only when site-packages changed"""
+        try:
+            site_mtime = os.stat(sysconfig.get_paths()['purelib']).st_mtime
+        except OSError:
+            site_mtime = None
+
+        cached = cache.get('pyinstaller')
+        if cached and site_mtime is not None and cached.get('site_mtime') == site_mtime:
+            return cached['version']
+
+        try:
+            import PyInstaller
+        except ImportError:
+            cache.pop('pyinstaller', None)
+            return None
+
+        cache['pyinstaller'] = {'version': PyInstaller.__version__, 'site_mtime': site_mtime}
+        return PyInstaller.__version__
+
     def check_dependencies(self):
         """Check if required dependencies are installed"""
         self.print_step("Checking dependencies...")
@@ -103,46 +319,95 @@ class BuildSystem:
             'python3': 'Python 3 is required',
             'pip3': 'pip3 is required for Python packages'
         }
+        if self.skip_frontend:
+            del dependencies['node'], dependencies['pnpm']
+
+        # Tool locations are cached per PATH so repeated builds skip the PATH walk
+        cache = self._load_dep_cache()
+        tools = cache['tools']
 
         missing = []
         for cmd, message in dependencies.items():
-            if not shutil.which(cmd):
+            path = tools.get(cmd)
+            if not path or not os.path.exists(path):
+                path = shutil.which(cmd)
+                if path:
+                    tools[cmd] = path
+                else:
+                    tools.pop(cmd, None)
+
+            if not path:
                 self.print_error(f"{cmd} not found: {message}")
                 missing.append(cmd)
             else:
                 self.print_success(f"{cmd} found")
 
+        # Check PyInstaller
+        pyinstaller_version = self._find_pyinstaller(cache)
+        self._save_dep_cache(cache)
+
         if missing:
             self.print_error(f"Missing dependencies: {', '.join(missing)}")
             return False
 
-        # Check PyInstaller
-        try:
-            import PyInstaller
-            self.print_success("PyInstaller found")
-        except ImportError:
+        if pyinstaller_version is None:
             self.print_error("PyInstaller not found. Install: pip3 install pyinstaller")
             return False
+        self.print_success(f"PyInstaller {pyinstaller_version} found")
 
         return True
 
+    def _sha256_file(self, path):
+        """Return the SHA256 hex digest of a file, or None if it is missing"""
+        try:
+            return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def _read_marker(self, marker):
+        """Read a stored hash marker from the build directory"""
+        try:
+            return marker.read_text().strip()
+        except OSError:
+            return None
+
+    def _write_marker(self, marker, digest):
+        """Store a hash marker in the build directory"""
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(digest)
+
+    def _lockfile_hash(self):
+        """Return the SHA256 of pnpm-lock.yaml"""
+        return self._sha256_file(self.root_dir / 'pnpm-lock.yaml')
+
     def build_frontend(self):
         """Build the React frontend"""
         self.print_step("Building frontend with Vite...")
 
-        # Install dependencies
-        if not (self.root_dir / 'node_modules').exists():
+        # Install dependencies only when the lockfile changed since the last
+        # install, resolving from pnpm's content-addressed store when possible
+        marker = self.build_dir / '.pnpm-lock.sha'
+        lock_hash = self._lockfile_hash()
+        if (not self._exists(self.root_dir / 'node_modules')
+                or lock_hash is None
+                or self._read_marker(marker) != lock_hash):
             self.print_step("Installing frontend dependencies...")
-            if not self.run_command(['pnpm', 'install']):
+            if not self.run_command(['pnpm', 'install', '--frozen-lockfile',
+                                     '--prefer-offline', '--reporter=append-only'],
+                                    prefix='pnpm-install'):
                 return False
+            if lock_hash is not None:
+                self._write_marker(marker, lock_hash)
             self.print_success("Frontend dependencies installed")
+        else:
+            self.print_success("Frontend dependencies up to date")
 
         # Build
-        if not self.run_command(['pnpm', 'build']):
+        if not self.run_command(['pnpm', 'build'], prefix='frontend'):
             self.print_error("Frontend build failed")
             return False
 
-        if not self.dist_dir.exists():
+        if not self._exists(self.dist_dir):
             self.print_error("Frontend build did not produce dist/ folder")
             return False
 
@@ -154,44 +419,118 @@ class BuildSystem:
         self.print_step("Installing Python dependencies...")
 
         requirements = self.server_dir / 'requirements.txt'
-        if not requirements.exists():
+        if not self._exists(requirements):
             self.print_error("requirements.txt not found")
             return False
 
-        if not self.run_command(['pip3', 'install', '-r', str(requirements)]):
+        # Skip pip entirely when requirements.txt hasn't changed since the
+        # last successful install; otherwise prefer cached wheels
+        # Keyed by platform since container builds share this build dir
+        marker = self.build_dir / f'.pip-req-{self.platform.lower()}.sha'
+        req_hash = self._sha256_file(requirements)
+        if self._read_marker(marker) == req_hash:
+            self.print_success("Python dependencies up to date")
+            return True
+
+        # PyInstaller is a build-only dependency, so it is installed in the
+        # same pip run rather than listed in the server requirements
+        command = [
+            'pip3', 'install', '-r', str(requirements), 'pyinstaller',
+            '--cache-dir', str(self.build_dir / 'pip-cache'),
+            '--prefer-binary',
+            '--disable-pip-version-check',
+        ]
+        if not self.run_command(command, prefix='pip'):
             self.print_error("Failed to install Python dependencies")
             return False
 
-        # Install PyInstaller if not present
-        if not self.run_command(['pip3', 'install', 'pyinstaller']):
-            self.print_warning("PyInstaller installation failed, may already be installed")
-
+        self._write_marker(marker, req_hash)
         self.print_success("Python dependencies installed")
         return True
 
-    def build_executable(self):
+    def prepare_build(self):
+        """Build the frontend and install Python dependencies concurrently"""
+        if self.skip_frontend:
+            # Container builds reuse the dist/ bundle built on the host
+            if not self._exists(self.dist_dir / 'index.html'):
+                self.print_error("--no-frontend requires an existing dist/ build")
+                return False
+            return self.install_python_deps()
+
+        # The frontend bundle and the pip install are independent, and both
+        # spend most of their time waiting on the network or on child
+        # processes, so overlap them. PyInstaller needs both to finish first.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            frontend = executor.submit(self.build_frontend)
+            python_deps = executor.submit(self.install_python_deps)
+            results = [frontend.result(), python_deps.result()]
+
+        return all(results)
+
+    def _workpath(self, target):
+        """PyInstaller work directory for a target"""
+        return self.build_dir / 'pyinstaller' / target.lower()
+
+    def _distpath(self, target):
+        """PyInstaller output directory for a target
+
+        Kept out of dist/, which holds the frontend build the spec bundles,
+        so container and native builds never overwrite (or bundle) each
+        other's executables.
+        """
+        return self.build_dir / 'dist' / target.lower()
+
+    def _needs_clean_build(self, spec_file, target):
+        """Check whether PyInstaller's cached analysis is older than the spec"""
+        if self.force:
+            return True
+
+        analysis = self._stat(self._workpath(target) / spec_file.stem / 'Analysis-00.toc')
+        if analysis is None:
+            return False
+
+        return self._stat(spec_file).st_mtime > analysis.st_mtime
+
+    def build_executable(self, target_platform=None):
         """Build executable with PyInstaller"""
-        self.print_step(f"Building executable for {self.platform}...")
+        target = target_platform or self.platform
+        self.print_step(f"Building executable for {target}...")
 
         spec_file = self.root_dir / 'murmur-brain.spec'
-        if not spec_file.exists():
+        if not self._exists(spec_file):
             self.print_error("murmur-brain.spec not found")
             return False
 
+        # Reuse PyInstaller's analysis cache unless it is stale, and give each
+        # target its own work, output and config dirs so parallel and
+        # container builds don't share the analysis, executables or
+        # stripped/bincache directories
+        command = [
+            'pyinstaller', '-y',
+            '--workpath', str(self._workpath(target)),
+            '--distpath', str(self._distpath(target)),
+            str(spec_file),
+        ]
+        if self._needs_clean_build(spec_file, target):
+            command.insert(1, '--clean')
+
+        env = os.environ.copy()
+        env['PYINSTALLER_CONFIG_DIR'] = str(self.build_dir / 'pyinstaller-config' / target.lower())
+
         # Run PyInstaller
-        if not self.run_command(['pyinstaller', '--clean', '-y', str(spec_file)]):
+        if not self.run_command(command, env=env, prefix=f"pyinstaller-{target.lower()}"):
             self.print_error("PyInstaller build failed")
             return False
 
-        self.print_success(f"Executable built for {self.platform}")
+        self.print_success(f"Executable built for {target}")
         return True
 
     def package_macos(self):
         """Package macOS .app and create .dmg"""
         self.print_step("Packaging for macOS...")
 
-        app_path = self.root_dir / 'dist' / 'Murmur-Brain.app'
-        if not app_path.exists():
+        app_path = self._distpath('Darwin') / 'Murmur-Brain.app'
+        if not self._exists(app_path):
             self.print_error(f"Application bundle not found at {app_path}")
             return False
 
@@ -199,11 +538,9 @@ class BuildSystem:
         macos_build_dir = self.build_dir / 'macos'
         macos_build_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy .app bundle
+        # Copy .app bundle (only changed files, cloned where possible)
         dest_app = macos_build_dir / 'Murmur-Brain.app'
-        if dest_app.exists():
-            shutil.rmtree(dest_app)
-        shutil.copytree(app_path, dest_app)
+        self.sync_tree(app_path, dest_app)
         self.print_success(f"Copied .app bundle to {macos_build_dir}")
 
         # TODO: Create .dmg (requires create-dmg or similar tool)
@@ -216,8 +553,8 @@ class BuildSystem:
         """Package Windows executable and create installer"""
         self.print_step("Packaging for Windows...")
 
-        exe_path = self.root_dir / 'dist' / 'Murmur-Brain.exe'
-        if not exe_path.exists():
+        exe_path = self._distpath('Windows') / 'Murmur-Brain.exe'
+        if not self._exists(exe_path):
             self.print_error(f"Executable not found at {exe_path}")
             return False
 
@@ -227,7 +564,7 @@ class BuildSystem:
 
         # Copy executable
         dest_exe = windows_build_dir / 'Murmur-Brain.exe'
-        shutil.copy(exe_path, dest_exe)
+        self._copy_if_changed(exe_path, dest_exe)
         self.print_success(f"Copied executable to {windows_build_dir}")
 
         # TODO: Create installer with NSIS
@@ -240,8 +577,8 @@ class BuildSystem:
         """Package Linux executable and create AppImage"""
         self.print_step("Packaging for Linux...")
 
-        app_dir = self.root_dir / 'dist' / 'Murmur-Brain'
-        if not app_dir.exists():
+        app_dir = self._distpath('Linux') / 'Murmur-Brain'
+        if not self._exists(app_dir):
             self.print_error(f"Application directory not found at {app_dir}")
             return False
 
@@ -249,11 +586,9 @@ class BuildSystem:
         linux_build_dir = self.build_dir / 'linux'
         linux_build_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy application directory
+        # Copy application directory (only changed files, cloned where possible)
         dest_dir = linux_build_dir / 'Murmur-Brain'
-        if dest_dir.exists():
-            shutil.rmtree(dest_dir)
-        shutil.copytree(app_dir, dest_dir)
+        self.sync_tree(app_dir, dest_dir)
         self.print_success(f"Copied application to {linux_build_dir}")
 
         # TODO: Create AppImage
@@ -265,18 +600,19 @@ class BuildSystem:
     def build_for_platform(self, target_platform=None):
         """Build for specific platform"""
         target = target_platform or self.platform
+        self._stat_cache.clear()
 
         # Build frontend and backend (common steps)
-        if not self.build_frontend():
+        if not self.prepare_build():
             return False
 
-        if not self.install_python_deps():
+        if not self.build_executable(target):
             return False
 
-        if not self.build_executable():
-            return False
+        return self.package_for_platform(target)
 
-        # Platform-specific packaging
+    def package_for_platform(self, target):
+        """Run the platform-specific packaging step"""
         if target == 'Darwin':  # macOS
             return self.package_macos()
         elif target == 'Windows':
@@ -287,25 +623,103 @@ class BuildSystem:
             self.print_error(f"Unsupported platform: {target}")
             return False
 
+    def _container_engine(self):
+        """Return the podman or docker executable, preferring podman"""
+        return shutil.which('podman') or shutil.which('docker')
+
+    def _container_image(self, target):
+        """Return the build image for a target, or None if there isn't one"""
+        override = os.environ.get(f"MURMUR_BUILD_IMAGE_{target.upper()}")
+        return override or CONTAINER_IMAGES.get(target)
+
+    def _run_in_container(self, target, image):
+        """Build one target inside a container over the mounted source tree
+
+        The host has already built dist/, so the container only installs
+        Python dependencies and runs PyInstaller into build/dist/<target>.
+        pip and PyInstaller caches live under build/cache/<target> and
+        persist between runs.
+        """
+        engine = self._container_engine()
+        cache_dir = self.build_dir / 'cache' / target.lower()
+        pip_cache = cache_dir / 'pip'
+        pyinstaller_cache = cache_dir / 'pyinstaller'
+        pip_cache.mkdir(parents=True, exist_ok=True)
+        pyinstaller_cache.mkdir(parents=True, exist_ok=True)
+
+        command = [
+            engine, 'run', '--rm',
+            '-v', f"{self.root_dir}:/src",
+            '-v', f"{pip_cache}:/root/.cache/pip",
+            '-v', f"{pyinstaller_cache}:/root/.pyinstaller",
+            '-w', '/src',
+            image,
+            'python3', 'build-all.py', f"--{TARGET_FLAGS[target]}", '--no-frontend',
+        ]
+        if self.force:
+            command.append('--force')
+
+        return self.run_command(command, prefix=f"container-{target.lower()}")
+
     def build_all(self):
         """Build for all platforms"""
         self.print_step("Building for all platforms...")
+        self._stat_cache.clear()
 
         platforms = ['Darwin', 'Windows', 'Linux']
         results = {}
+        native = []
+        containers = {}
+        engine = self._container_engine()
 
         for platform_name in platforms:
-            self.print_step(f"\n{'='*60}")
-            self.print_step(f"Building for {platform_name}")
-            self.print_step(f"{'='*60}")
-
+            image = self._container_image(platform_name)
             if platform_name == self.platform or platform_name.startswith(self.platform):
-                results[platform_name] = self.build_for_platform(platform_name)
+                native.append(platform_name)
+            elif engine and image:
+                containers[platform_name] = image
             else:
                 self.print_warning(f"Cross-compilation for {platform_name} not supported")
-                self.print_warning("Build on native platform or use CI/CD")
+                self.print_warning("Build on native platform, set a container image or use CI/CD")
                 results[platform_name] = False
 
+        # The frontend and executable are shared, so build them once and
+        # only fan out the per-platform packaging steps
+        if not self.prepare_build():
+            results.update({platform_name: False for platform_name in native + list(containers)})
+            native, containers = [], {}
+
+        # Container builds only read dist/ and write their own
+        # build/dist/<target>, so start them before the native PyInstaller
+        # run and let them proceed alongside it
+        executor = None
+        futures = {}
+        if containers:
+            # Each worker only waits on its container's child process
+            executor = ThreadPoolExecutor(max_workers=len(containers))
+            futures = {
+                executor.submit(self._run_in_container, platform_name, image): platform_name
+                for platform_name, image in containers.items()
+            }
+
+        if native:
+            built = self.build_executable()
+            if not built:
+                results.update({platform_name: False for platform_name in native})
+            else:
+                for platform_name in native:
+                    results[platform_name] = self.package_for_platform(platform_name)
+
+        if executor is not None:
+            for future in as_completed(futures):
+                platform_name = futures[future]
+                try:
+                    results[platform_name] = future.result()
+                except Exception as e:
+                    self.print_error(f"Container build for {platform_name} failed: {e}")
+                    results[platform_name] = False
+            executor.shutdown()
+
         # Summary
         self.print_step("\n" + "="*60)
         self.print_step("Build Summary")
@@ -327,9 +741,13 @@ def main():
     parser.add_argument('--linux', action='store_true', help='Build for Linux')
     parser.add_argument('--clean', action='store_true', help='Clean build artifacts')
     parser.add_argument('--check', action='store_true', help='Check dependencies only')
+    parser.add_argument('--no-frontend', action='store_true',
+                        help='Reuse the existing dist/ frontend build (used by container builds)')
+    parser.add_argument('--force', action='store_true',
+                        help='Discard the PyInstaller cache and re-analyze all modules')
 
     args = parser.parse_args()
-    builder = BuildSystem()
+    builder = BuildSystem(force=args.force, skip_frontend=args.no_frontend)
 
     # Print header
     print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.END}")
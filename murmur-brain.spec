@@ -38,7 +38,14 @@ hiddenimports = [
     'uvicorn.protocols.websockets.auto',
     'uvicorn.lifespan',
     'uvicorn.lifespan.on',
+    'uvicorn.loops.uvloop',
+    'uvicorn.protocols.http.httptools_impl',
+    'uvloop',
+    'httptools',
     'pydantic',
+    'pydantic_settings',
+    'orjson',
+    'httpx',
     'pypdf',
     'python_multipart',
     'aiofiles',
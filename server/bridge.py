@@ -2,6 +2,7 @@
 Python-JavaScript Bridge for Desktop App
 Provides communication interface between Python backend and webview frontend
 """
+import webview
 
 
 class DesktopBridge:
@@ -13,6 +14,7 @@ class DesktopBridge:
     def __init__(self, port: int, api_url: str):
         self.port = port
         self.api_url = api_url
+        self._webview = webview
 
     def get_port(self) -> int:
         """Get the backend server port"""
@@ -24,7 +26,6 @@ class DesktopBridge:
 
     def quit_app(self):
         """Quit the application"""
-        import webview
-        windows = webview.windows
-        for window in windows:
+        # Snapshot the list: destroying a window removes it from webview.windows
+        for window in list(self._webview.windows):
             window.destroy()
@@ -3,14 +3,21 @@ Configuration management for Murmur Brain backend.
 
 Provides application settings and environment configuration.
 """
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 
 
-class Settings(BaseModel):
-    """Application settings with defaults."""
+class Settings(BaseSettings):
+    """Application settings with defaults, overridable via LOCAL_BRAIN_* env vars."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="LOCAL_BRAIN_",
+        case_sensitive=False,
+        frozen=True
+    )
 
     # Application
     app_name: str = "Murmur Brain"
@@ -23,12 +30,24 @@ class Settings(BaseModel):
 
     # Database
     db_path: Optional[str] = None
+    db_mmap_size: int = 1024 * 1024 * 1024  # Bytes of the file memory-mapped for reads (0 = off)
+    db_cache_size_kb: int = 128 * 1024  # Page cache per connection
 
     # Ollama
     ollama_base_url: str = "http://127.0.0.1:11434"
     ollama_embedding_model: str = "nomic-embed-text"
     ollama_default_chat_model: str = "llama3.2"
     ollama_timeout: int = 120
+    ollama_warm_up_chat: bool = True  # Load the default chat model at startup
+    ollama_concurrency: int = 4  # Concurrent /api/embed batch requests
+    embedding_cache_enabled: bool = True  # Reuse embeddings of identical text
+    embedding_cache_max_age_days: int = 90  # Pruned at startup (0 = keep forever)
+    embedding_memo_size: int = 1024  # In-process LRU of recent single embeddings (e.g. queries)
+    # "ollama" or "fastembed" (in-process ONNX, requires the fastembed package).
+    # Documents must be re-indexed after switching, and embedding_dimensions
+    # must match the model (384 for bge-small-en-v1.5).
+    embedding_provider: str = "ollama"
+    fastembed_model: str = "BAAI/bge-small-en-v1.5"
 
     # File Processing
     max_file_size: int = 50 * 1024 * 1024  # 50MB
@@ -47,23 +66,25 @@ class Settings(BaseModel):
     default_top_k: int = 5
     default_similarity_threshold: float = 0.0
     embedding_dimensions: int = 768
+    embedding_quantization: str = "none"  # Stored embedding BLOBs: "none" (float32) or "int8"
+
+    # FAISS index (faiss.index_factory string, e.g. "Flat", "IVF1024,Flat", "HNSW32")
+    faiss_index_type: str = "Flat"
+    faiss_nprobe: int = 16  # IVF lists probed per query
+    faiss_use_gpu: bool = False  # Requires a GPU build of faiss
+    faiss_quantize: str = "none"  # Vector storage: "none" (float32), "fp16" or "int8"
+    faiss_save_threshold: int = 1000  # Changed vectors before the index is written (0 = every change)
+
+    # Semantic cache of search results for near-duplicate queries
+    semantic_cache_size: int = 0  # Cached query clusters; opt-in, near-duplicate queries share results (0 = disabled)
+    semantic_cache_threshold: float = 0.86  # Cosine similarity for a hit
 
     # Chat
     rag_context_limit: int = 5
     chat_title_generation: bool = True
 
-    class Config:
-        env_prefix = "LOCAL_BRAIN_"
-        case_sensitive = False
-
-
-# Singleton settings instance
-_settings: Optional[Settings] = None
-
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create the singleton settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
@@ -5,13 +5,56 @@ Provides a singleton database connection and base repository class
 for all feature modules to extend.
 """
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Sequence
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 import sqlite3
+import threading
+from .config import get_settings
+
+
+# Applied to every new connection. WAL lets readers proceed while a writer
+# holds the lock, which only helps if each thread has its own connection.
+# The large autocheckpoint suits bulk embedding inserts. Memory-related
+# values come from settings (db_mmap_size, db_cache_size_kb).
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size={mmap_size};
+    PRAGMA cache_size=-{cache_size_kb};
+    PRAGMA wal_autocheckpoint=10000;
+    PRAGMA busy_timeout=5000;
+"""
+
+
+@lru_cache(maxsize=1)
+def _connection_pragmas() -> str:
+    """Build the per-connection PRAGMA script from settings once."""
+    settings = get_settings()
+    return _CONNECTION_PRAGMAS.format(
+        mmap_size=max(0, settings.db_mmap_size),
+        cache_size_kb=max(0, settings.db_cache_size_kb)
+    )
+
+# Page size only takes effect on an empty database, before WAL is enabled
+_NEW_DATABASE_PAGE_SIZE = 8192
+
+
+def dict_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Row factory returning plain dicts, so fetches need no second pass."""
+    return dict(zip([column[0] for column in cursor.description], row))
 
 
 class DatabaseConnection:
-    """Manages SQLite database connection with WAL mode enabled."""
+    """
+    Manages per-thread SQLite connections with WAL mode enabled.
+
+    FastAPI runs sync dependencies and endpoints on a thread pool, so each
+    worker thread lazily opens its own connection instead of sharing one
+    connection (and its internal mutex) across all of them.
+    """
 
     def __init__(self, db_path: Optional[str] = None):
         if db_path is None:
@@ -22,61 +65,96 @@ class DatabaseConnection:
             db_path = str(db_dir / "murmur-brain.db")
 
         self.db_path = db_path
-        self.conn = None
+        self._local = threading.local()
         self.initialize()
 
     def initialize(self):
-        """Initialize database connection and enable WAL mode."""
-        # Use standard sqlite3
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        """Open the connection for the current thread and enable WAL mode."""
+        self._get_conn()
+        print(f"Database initialized at: {self.db_path}")
 
-        # Enable WAL mode for better concurrency
-        cursor = self.conn.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.close()
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get the current thread's connection, creating it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            conn.row_factory = dict_factory
 
-        print(f"Database initialized at: {self.db_path}")
+            if conn.execute("PRAGMA page_count").fetchone()["page_count"] == 0:
+                conn.execute(f"PRAGMA page_size={_NEW_DATABASE_PAGE_SIZE}")
+            conn.executescript(_connection_pragmas())
+
+            # Closed when the owning thread exits and its locals are released
+            self._local.conn = conn
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection bound to the calling thread."""
+        return self._get_conn()
 
     @contextmanager
     def get_cursor(self):
         """Context manager for database cursor operations."""
-        cursor = self.conn.cursor()
+        conn = self._get_conn()
+        cursor = conn.cursor()
         try:
             yield cursor
-            self.conn.commit()
+            conn.commit()
         except Exception as e:
-            self.conn.rollback()
+            conn.rollback()
             raise e
         finally:
             cursor.close()
 
     def execute(self, query: str, params: tuple = ()):
         """Execute a query and return cursor."""
-        return self.conn.execute(query, params)
+        return self._get_conn().execute(query, params)
 
-    def fetchone(self, query: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+    def executemany(self, query: str, params: Iterable[Sequence]):
+        """Execute a query once per parameter tuple and return cursor."""
+        return self._get_conn().executemany(query, params)
+
+    def fetchone(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
         """Execute query and fetch one result."""
-        cursor = self.conn.execute(query, params)
+        cursor = self._get_conn().execute(query, params)
         return cursor.fetchone()
 
-    def fetchall(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
+    def fetchall(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Execute query and fetch all results."""
-        cursor = self.conn.execute(query, params)
+        cursor = self._get_conn().execute(query, params)
         return cursor.fetchall()
 
+    def iterchunks(self, query: str, params: tuple = (), size: int = 8192) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute query and yield results in lists of at most size rows.
+
+        Only one chunk is held in memory at a time, unlike fetchall.
+        """
+        cursor = self._get_conn().execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
     def commit(self):
         """Commit current transaction."""
-        self.conn.commit()
+        self._get_conn().commit()
 
     def rollback(self):
         """Rollback current transaction."""
-        self.conn.rollback()
+        self._get_conn().rollback()
 
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close the calling thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
 
 class BaseRepository:
@@ -89,15 +167,40 @@ class BaseRepository:
     def __init__(self, db: DatabaseConnection):
         self.db = db
 
-    def _dict_from_row(self, row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
-        """Convert sqlite3.Row to dictionary."""
-        if row is None:
-            return None
-        return dict(row)
+    def bulk_insert(self, query: str, rows: Iterable[Sequence], batch_size: int = 1000) -> int:
+        """
+        Insert many rows with executemany inside a single transaction.
+
+        Args:
+            query: Parameterized INSERT statement
+            rows: Iterable of parameter tuples
+            batch_size: Number of rows passed to each executemany call
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            Exception: If any insert fails (the whole transaction is rolled back)
+        """
+        conn = self.db.conn
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+
+        count = 0
+        rows = iter(rows)
+        try:
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                conn.executemany(query, batch)
+                count += len(batch)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
 
-    def _dicts_from_rows(self, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
-        """Convert list of sqlite3.Row to list of dictionaries."""
-        return [dict(row) for row in rows]
+        return count
 
 
 # Singleton database connection instance
@@ -3,28 +3,87 @@ FastAPI dependency injection providers.
 
 Provides dependency functions for use with FastAPI's Depends() pattern.
 """
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Optional
 from .database import DatabaseConnection, get_db_connection
 from .ollama_client import OllamaClient, get_ollama_client
 from .config import Settings, get_settings
-from .faiss_manager import FaissIndexManager
 
-# Singleton FAISS manager instance
-_faiss_manager: Optional[FaissIndexManager] = None
+if TYPE_CHECKING:
+    from .faiss_manager import FaissIndexManager
+    from modules.documents.documents_model import DocumentRepository
+    from modules.documents.documents_service import DocumentService
+    from modules.search.search_service import SearchService
+    from modules.chats.chats_service import ChatService
+    from modules.ollama.ollama_service import OllamaService
 
+# Singletons bound once at import so each Depends() is a plain global load
+_CFG: Settings = get_settings()
+_DB: DatabaseConnection = get_db_connection()
+_OLLAMA: OllamaClient = get_ollama_client()
 
-def get_faiss_manager() -> FaissIndexManager:
+# Created on first use; loading the index pulls in the faiss extension
+_FAISS: Optional["FaissIndexManager"] = None
+
+
+def get_faiss_manager() -> "FaissIndexManager":
     """
     Get or create the singleton FAISS manager instance.
 
     Returns:
         FaissIndexManager instance
     """
-    global _faiss_manager
-    if _faiss_manager is None:
-        settings = get_settings()
-        _faiss_manager = FaissIndexManager(embedding_dim=settings.embedding_dimensions)
-    return _faiss_manager
+    global _FAISS
+    if _FAISS is None:
+        from .faiss_manager import FaissIndexManager
+        _FAISS = FaissIndexManager(
+            embedding_dim=_CFG.embedding_dimensions,
+            index_type=_CFG.faiss_index_type,
+            nprobe=_CFG.faiss_nprobe,
+            use_gpu=_CFG.faiss_use_gpu,
+            quantize=_CFG.faiss_quantize,
+            save_threshold=_CFG.faiss_save_threshold
+        )
+    return _FAISS
+
+
+# Repositories and services shared by every request, built by init_services()
+_DOC_REPO: Optional["DocumentRepository"] = None
+_DOC_SERVICE: Optional["DocumentService"] = None
+_SEARCH_SERVICE: Optional["SearchService"] = None
+_CHAT_SERVICE: Optional["ChatService"] = None
+_OLLAMA_SERVICE: Optional["OllamaService"] = None
+
+
+def init_services():
+    """
+    Build the repositories and services shared by every request.
+
+    Called from the startup hook once the database is migrated and the
+    FAISS index is loaded; the providers below also call it on first use.
+    """
+    global _DOC_REPO, _DOC_SERVICE, _SEARCH_SERVICE, _CHAT_SERVICE, _OLLAMA_SERVICE
+    from modules.documents.documents_model import DocumentRepository
+    from modules.documents.documents_processor import FileProcessor
+    from modules.documents.documents_service import DocumentService
+    from modules.search.search_model import VectorRepository
+    from modules.search.search_service import SearchService
+    from modules.chats.chats_model import ChatRepository
+    from modules.chats.chats_service import ChatService
+    from modules.messages.messages_model import MessageRepository
+    from modules.ollama.ollama_service import OllamaService
+
+    faiss_manager = get_faiss_manager()
+    _DOC_REPO = DocumentRepository(_DB, faiss_manager)
+    _DOC_SERVICE = DocumentService(_DOC_REPO, _OLLAMA, FileProcessor())
+    _SEARCH_SERVICE = SearchService(VectorRepository(_DB), _OLLAMA, faiss_manager)
+    _CHAT_SERVICE = ChatService(ChatRepository(_DB), MessageRepository(_DB), _SEARCH_SERVICE, _OLLAMA)
+    _OLLAMA_SERVICE = OllamaService(_OLLAMA)
+
+
+def close_faiss_manager():
+    """Write any unsaved FAISS index changes to disk."""
+    if _FAISS is not None and _FAISS.dirty:
+        _FAISS.save()
 
 
 def get_db() -> DatabaseConnection:
@@ -36,7 +95,7 @@ def get_db() -> DatabaseConnection:
         def endpoint(db: DatabaseConnection = Depends(get_db)):
             ...
     """
-    return get_db_connection()
+    return _DB
 
 
 def get_ollama() -> OllamaClient:
@@ -48,7 +107,7 @@ def get_ollama() -> OllamaClient:
         def endpoint(ollama: OllamaClient = Depends(get_ollama)):
             ...
     """
-    return get_ollama_client()
+    return _OLLAMA
 
 
 def get_config() -> Settings:
@@ -60,10 +119,10 @@ def get_config() -> Settings:
         def endpoint(config: Settings = Depends(get_config)):
             ...
     """
-    return get_settings()
+    return _CFG
 
 
-def get_faiss() -> FaissIndexManager:
+def get_faiss() -> "FaissIndexManager":
     """
     Dependency that provides FAISS manager.
 
@@ -72,4 +131,41 @@ def get_faiss() -> FaissIndexManager:
         def endpoint(faiss: FaissIndexManager = Depends(get_faiss)):
             ...
     """
+    if _FAISS is not None:
+        return _FAISS
     return get_faiss_manager()
+
+
+def get_document_repository() -> "DocumentRepository":
+    """Dependency that provides document repository."""
+    if _DOC_REPO is None:
+        init_services()
+    return _DOC_REPO
+
+
+def get_document_service() -> "DocumentService":
+    """Dependency that provides document service."""
+    if _DOC_SERVICE is None:
+        init_services()
+    return _DOC_SERVICE
+
+
+def get_search_service() -> "SearchService":
+    """Dependency that provides search service."""
+    if _SEARCH_SERVICE is None:
+        init_services()
+    return _SEARCH_SERVICE
+
+
+def get_chat_service() -> "ChatService":
+    """Dependency that provides chat service."""
+    if _CHAT_SERVICE is None:
+        init_services()
+    return _CHAT_SERVICE
+
+
+def get_ollama_service() -> "OllamaService":
+    """Dependency that provides Ollama service."""
+    if _OLLAMA_SERVICE is None:
+        init_services()
+    return _OLLAMA_SERVICE
@@ -0,0 +1,151 @@
+"""
+Content-addressed embedding cache.
+
+Stores embeddings in the embedding_cache table keyed by a hash of the
+model name and text, so identical chunks aren't sent to Ollama again.
+"""
+import hashlib
+import sqlite3
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from .database import BaseRepository
+from .embedding_codec import encode_embedding, decode_embedding
+
+# Keys per SELECT ... IN (...), below SQLite's default 999 variable limit
+LOOKUP_BATCH_SIZE = 500
+
+
+class EmbeddingCache(BaseRepository):
+    """SQLite-backed cache of embeddings by (model, text) content hash."""
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        """
+        Build the cache key for a text.
+
+        The model name is part of the hash so switching embedding models
+        never returns vectors from the previous model.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+
+        Returns:
+            SHA-256 digest bytes
+        """
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """
+        Look up a cached embedding.
+
+        Args:
+            model: Embedding model name
+            text: Text to look up
+
+        Returns:
+            Float32 embedding vector, or None on a miss
+        """
+        try:
+            row = self.db.fetchone("""
+                SELECT vector FROM embedding_cache WHERE key = ?
+            """, (self.key(model, text),))
+        except sqlite3.Error as e:
+            print(f"Warning: Embedding cache lookup failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return decode_embedding(row["vector"])
+
+    def set(self, model: str, text: str, embedding: Union[Sequence[float], np.ndarray]):
+        """
+        Store an embedding in the cache.
+
+        Args:
+            model: Embedding model name
+            text: Text that was embedded
+            embedding: Embedding vector
+        """
+        if len(embedding) == 0:
+            return
+
+        try:
+            self.db.execute("""
+                INSERT OR REPLACE INTO embedding_cache (key, model, vector)
+                VALUES (?, ?, ?)
+            """, (self.key(model, text), model, encode_embedding(embedding)))
+            self.db.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Embedding cache write failed: {e}")
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up cached embeddings for several texts with batched IN queries.
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            Float32 embedding vector or None for each text, in order
+        """
+        keys = [self.key(model, text) for text in texts]
+        found = {}
+        try:
+            for i in range(0, len(keys), LOOKUP_BATCH_SIZE):
+                batch = keys[i:i + LOOKUP_BATCH_SIZE]
+                rows = self.db.fetchall(f"""
+                    SELECT key, vector FROM embedding_cache
+                    WHERE key IN ({",".join("?" * len(batch))})
+                """, tuple(batch))
+                found.update((row["key"], row["vector"]) for row in rows)
+        except sqlite3.Error as e:
+            print(f"Warning: Embedding cache lookup failed: {e}")
+            return [None] * len(texts)
+
+        return [
+            decode_embedding(found[key]) if key in found else None
+            for key in keys
+        ]
+
+    def set_many(self, model: str, items: Iterable[Tuple[str, Union[Sequence[float], np.ndarray]]]):
+        """
+        Store several embeddings in one transaction.
+
+        Args:
+            model: Embedding model name
+            items: (text, embedding) pairs; empty embeddings are skipped
+        """
+        rows = (
+            (self.key(model, text), model, encode_embedding(embedding))
+            for text, embedding in items if len(embedding)
+        )
+        try:
+            self.bulk_insert("""
+                INSERT OR REPLACE INTO embedding_cache (key, model, vector)
+                VALUES (?, ?, ?)
+            """, rows)
+        except sqlite3.Error as e:
+            print(f"Warning: Embedding cache write failed: {e}")
+
+    def prune(self, max_age_days: float) -> int:
+        """
+        Delete cache entries older than max_age_days.
+
+        Args:
+            max_age_days: Maximum entry age in days
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            cursor = self.db.execute("""
+                DELETE FROM embedding_cache
+                WHERE created_at < datetime('now', ?)
+            """, (f"-{max_age_days} days",))
+            self.db.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Warning: Embedding cache prune failed: {e}")
+            return 0
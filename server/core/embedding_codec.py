@@ -0,0 +1,70 @@
+"""
+Embedding BLOB encoding for the vectors table.
+
+Embeddings are stored as raw little-endian float32 bytes so they can be
+decoded with a zero-copy numpy view. With settings.embedding_quantization
+set to "int8" they are stored as a magic header, a float32 scale and one
+int8 per dimension instead (4x smaller). Rows written before either format
+used UTF-8 JSON arrays, which are still decoded on a slower fallback path.
+"""
+from typing import Optional, Sequence, Union
+import numpy as np
+import orjson
+from .config import get_settings
+
+# Little-endian float32, independent of the host byte order
+EMBEDDING_DTYPE = np.dtype("<f4")
+
+# Prefix of int8 blobs. As a float32 it would be a ~1e-41 denormal, which
+# real embeddings don't start with.
+INT8_MAGIC = b"Q8\x00\x00"
+INT8_HEADER_SIZE = len(INT8_MAGIC) + EMBEDDING_DTYPE.itemsize
+
+
+def encode_embedding(
+    embedding: Union[Sequence[float], np.ndarray],
+    quantization: Optional[str] = None
+) -> bytes:
+    """
+    Encode an embedding vector for BLOB storage.
+
+    Args:
+        embedding: Embedding vector
+        quantization: "none" or "int8" (defaults to settings.embedding_quantization)
+
+    Returns:
+        Raw float32 bytes, or the int8 header and codes
+    """
+    vector = np.asarray(embedding, dtype=EMBEDDING_DTYPE)
+    if (quantization or get_settings().embedding_quantization) != "int8":
+        return vector.tobytes()
+
+    # Symmetric per-vector scale: q = round(v * 127 / max|v|)
+    max_abs = float(np.abs(vector).max()) if vector.size else 0.0
+    scale = max_abs / 127.0 if max_abs > 0 else 1.0
+    codes = np.rint(vector / scale).astype(np.int8)
+    return INT8_MAGIC + np.array(scale, dtype=EMBEDDING_DTYPE).tobytes() + codes.tobytes()
+
+
+def decode_embedding(blob: bytes) -> np.ndarray:
+    """
+    Decode an embedding BLOB into a float32 array.
+
+    Args:
+        blob: Stored embedding bytes (raw float32, int8 or legacy JSON)
+
+    Returns:
+        1-D float32 array (read-only view for raw float32 blobs)
+    """
+    if blob[:len(INT8_MAGIC)] == INT8_MAGIC:
+        scale = np.frombuffer(blob, dtype=EMBEDDING_DTYPE, count=1, offset=len(INT8_MAGIC))[0]
+        codes = np.frombuffer(blob, dtype=np.int8, offset=INT8_HEADER_SIZE)
+        return codes.astype(np.float32) * scale
+    if blob[:1] == b"[" and blob[-1:] == b"]":
+        # Legacy JSON-encoded embedding. Raw float32 bytes can start and end
+        # with these bytes by chance but won't parse as JSON.
+        try:
+            return np.asarray(orjson.loads(blob), dtype=np.float32)
+        except orjson.JSONDecodeError:
+            pass
+    return np.frombuffer(blob, dtype=EMBEDDING_DTYPE)
@@ -3,24 +3,73 @@ FAISS Index Manager for Local Brain.
 
 Provides efficient vector similarity search using Facebook AI Similarity Search (FAISS).
 """
+from functools import wraps
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+import os
+import threading
+from typing import List, Dict, Optional, Tuple, Union
+import logging
 import numpy as np
-import faiss
 import pickle
-import json
+from .embedding_codec import decode_embedding
+
+logger = logging.getLogger(__name__)
+
+# The faiss extension is large and slow to load, so it is imported when the
+# first FaissIndexManager is created rather than when this module is imported
+faiss = None
+
+# Squared norms within this distance of 1.0 are treated as already normalized
+NORM_TOLERANCE = 1e-4
+
+
+def _import_faiss():
+    """Import the faiss extension module on first use."""
+    global faiss
+    if faiss is None:
+        import faiss as faiss_module
+        faiss = faiss_module
+        # Batched searches are parallelized across queries with OpenMP
+        faiss.omp_set_num_threads(os.cpu_count() or 1)
+    return faiss
+
+
+def _synchronized(method):
+    """Run a FaissIndexManager method while holding the manager's lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class FaissIndexManager:
     """Manages FAISS index for vector similarity search."""
 
-    def __init__(self, index_path: Optional[str] = None, embedding_dim: int = 768):
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        embedding_dim: int = 768,
+        index_type: str = "Flat",
+        nprobe: int = 16,
+        use_gpu: bool = False,
+        quantize: str = "none",
+        save_threshold: int = 0
+    ):
         """
         Initialize FAISS index manager.
 
         Args:
             index_path: Path to store/load FAISS index
             embedding_dim: Dimension of embedding vectors
+            index_type: faiss.index_factory description, e.g. "Flat" for exact
+                search or "IVF1024,Flat" / "HNSW32" for approximate search
+            nprobe: Number of inverted lists probed per query for IVF indexes
+            use_gpu: Mirror the index onto GPU 0 for unfiltered searches when
+                faiss was built with GPU support
+            quantize: Vector storage for Flat-based index types: "none"
+                (float32), "fp16" (half the memory) or "int8" (a quarter,
+                small recall cost)
         """
         if index_path is None:
             # Use standard application support directory
@@ -31,32 +80,232 @@ class FaissIndexManager:
 
         self.index_path = index_path
         self.embedding_dim = embedding_dim
+        self.index_type = index_type
+        self.nprobe = nprobe
+        self.quantize = quantize
+        _import_faiss()
+
+        # Initialize FAISS index (inner product over normalized vectors)
+        self.index = self._new_index()
+
+        # Uploads update the index from worker threads while requests search
+        # it, so reads and writes of the index are serialized
+        self._lock = threading.RLock()
+
+        # vector_id for each FAISS id: ids are positions in this list and
+        # removed ids leave None. The reverse map is only built when needed.
+        self._ids: List[Optional[str]] = []
+        self._id_to_index: Optional[Dict[str, int]] = None
+
+        # Vectors added or removed since the last save
+        self.save_threshold = save_threshold
+        self.dirty = 0
 
-        # Initialize FAISS index (IndexFlatIP for cosine similarity)
-        self.index = faiss.IndexFlatIP(embedding_dim)
+        # Bumped on every change so caches of search results can invalidate
+        self.version = 0
 
-        # Mapping from FAISS index position to vector_id
-        self.id_to_index: Dict[str, int] = {}
-        self.index_to_id: Dict[int, str] = {}
+        # Reused float32 staging matrix for add_vectors (faiss copies on add)
+        self._add_buffer: Optional[np.ndarray] = None
+
+        # Set when the loaded index is a read-only memory map of the file
+        self._readonly = False
+
+        # Cleared once the index rejects SearchParameters (IndexIDMap2 does
+        # in faiss-cpu 1.7.4); filtered searches then post-filter instead
+        self._selector_search = True
+
+        # Optional GPU mirror of the index; the CPU index stays authoritative
+        self._gpu_res = None
+        self.gpu_index = None
+        self._gpu_stale = False
 
         # Try to load existing index
         self.load()
 
-    def normalize_embedding(self, embedding: List[float]) -> np.ndarray:
+        if use_gpu:
+            self._init_gpu()
+
+    @property
+    def id_to_index(self) -> Dict[str, int]:
+        """Mapping from vector_id to FAISS id, built on first access."""
+        if self._id_to_index is None:
+            self._id_to_index = {vid: i for i, vid in enumerate(self._ids) if vid is not None}
+        return self._id_to_index
+
+    def _reset_ids(self, ids: Optional[List[Optional[str]]] = None):
+        """Replace the id list and drop the derived reverse map."""
+        self._ids = ids if ids is not None else []
+        self._id_to_index = None
+
+    def _init_gpu(self):
+        """Set up GPU resources, falling back to CPU-only search on failure."""
+        try:
+            self._gpu_res = faiss.StandardGpuResources()
+            self.to_gpu()
+            logger.info("FAISS GPU search enabled")
+        except (AttributeError, RuntimeError) as e:
+            # AttributeError: faiss-cpu build without GPU support
+            logger.warning("FAISS GPU unavailable, using CPU search: %s", e)
+            self._gpu_res = None
+            self.gpu_index = None
+
+    def to_gpu(self) -> bool:
+        """
+        Copy the current CPU index to GPU 0.
+
+        Returns:
+            True if a GPU copy was made
         """
-        Normalize embedding for cosine similarity with IndexFlatIP.
+        if self._gpu_res is None:
+            return False
+        self.gpu_index = faiss.index_cpu_to_gpu(self._gpu_res, 0, self.index)
+        self._gpu_stale = False
+        return True
+
+    def _ensure_writable(self):
+        """Load a memory-mapped, read-only index into RAM before mutating it."""
+        if self._readonly:
+            # faiss can't clone mapped inverted lists, but nothing changed
+            # since load, so the file holds the same index
+            self.index = faiss.read_index(self.index_path)
+            self._apply_search_params(self.index)
+            self._readonly = False
+
+    def _mark_gpu_stale(self):
+        """Flag the GPU copy for refresh after the CPU index changed."""
+        if self._gpu_res is not None:
+            self._gpu_stale = True
+
+    def _new_index(self):
+        """
+        Create an empty index of the configured type.
+
+        Vectors are L2-normalized before they are added or searched, so inner
+        product ranks by cosine similarity for every index type. IndexIDMap2
+        keeps our own int64 ids alongside the vectors, so removals use
+        remove_ids in C++ instead of rebuilding the index.
+
+        Returns:
+            Empty FAISS index
+        """
+        index = faiss.index_factory(self.embedding_dim, self._index_description(), faiss.METRIC_INNER_PRODUCT)
+        index = faiss.IndexIDMap2(index)
+        self._apply_search_params(index)
+        return index
+
+    def _index_description(self) -> str:
+        """
+        index_factory string with the configured vector storage applied.
+
+        The float32 "Flat" storage of e.g. "Flat" or "IVF1024,Flat" is swapped
+        for a scalar quantizer; search still takes float32 queries and faiss
+        quantizes internally.
+
+        Returns:
+            index_factory description string
+        """
+        codes = {"fp16": "SQfp16", "int8": "SQ8"}.get(self.quantize)
+        if codes is None:
+            return self.index_type
+        if not self.index_type.endswith("Flat"):
+            logger.warning("FAISS quantize=%s ignored for index type %s", self.quantize, self.index_type)
+            return self.index_type
+        return self.index_type[:-len("Flat")] + codes
+
+    def _apply_search_params(self, index):
+        """
+        Apply nprobe to the index if it is IVF-based.
 
         Args:
-            embedding: Embedding vector
+            index: FAISS index (possibly wrapped in IndexIDMap2)
+        """
+        try:
+            ivf = faiss.extract_index_ivf(index)
+        except RuntimeError:
+            return  # Not an IVF index
+        ivf.nprobe = self.nprobe
+
+    def _training_size(self) -> int:
+        """
+        Number of vectors to sample when training the index.
 
         Returns:
-            Normalized numpy array
+            Sample size (about 39 points per IVF list, at least 10000)
         """
-        arr = np.array(embedding, dtype=np.float32).reshape(1, -1)
-        faiss.normalize_L2(arr)
+        try:
+            nlist = faiss.extract_index_ivf(self.index).nlist
+        except RuntimeError:
+            nlist = 0
+        return max(nlist * 39, 10000)
+
+    def train(self, training_vectors: Union[List[List[float]], np.ndarray]) -> bool:
+        """
+        Train the index if its type requires it (e.g. IVF, PQ).
+
+        Args:
+            training_vectors: Representative embedding vectors
+
+        Returns:
+            True if the index is trained afterwards
+        """
+        if self.index.is_trained:
+            return True
+
+        self._ensure_writable()
+        vectors = self._normalize_rows(np.array(training_vectors, dtype=np.float32))
+        logger.info("Training FAISS %s index on %d vectors...", self.index_type, len(vectors))
+        self.index.train(vectors)
+        return self.index.is_trained
+
+    @staticmethod
+    def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize a float32 matrix in place, skipping unit-norm rows.
+
+        Ollama's embedding models usually return normalized vectors, so one
+        squared-norm pass is often enough to skip the rescaling entirely.
+
+        Args:
+            vectors: Float32 matrix of shape (n, d), modified in place
+
+        Returns:
+            The same matrix
+        """
+        norms = np.einsum("ij,ij->i", vectors, vectors)
+        mask = np.abs(norms - 1.0) > NORM_TOLERANCE
+        if mask.all():
+            faiss.normalize_L2(vectors)
+        elif mask.any():
+            # Zero vectors are left as-is, matching normalize_L2
+            mask &= norms > 0
+            vectors[mask] /= np.sqrt(norms[mask])[:, None]
+        return vectors
+
+    def normalize_embedding(self, embedding: Union[List[float], np.ndarray]) -> np.ndarray:
+        """
+        Normalize a single embedding for cosine similarity search.
+
+        Args:
+            embedding: Embedding vector (list or numpy array)
+
+        Returns:
+            Normalized float32 array of shape (1, d)
+        """
+        if isinstance(embedding, np.ndarray):
+            # astype always copies, so the caller's array is left untouched
+            arr = embedding.astype(np.float32).reshape(1, -1)
+        else:
+            # fromiter skips np.array's generic sequence probing
+            arr = np.fromiter(embedding, dtype=np.float32, count=len(embedding)).reshape(1, -1)
+
+        # One vector: scale in numpy rather than a SWIG normalize_L2 call
+        squared_norm = float(np.dot(arr[0], arr[0]))
+        if squared_norm > 0 and abs(squared_norm - 1.0) > NORM_TOLERANCE:
+            arr *= 1.0 / np.sqrt(squared_norm)
         return arr
 
-    def add_vectors(self, vector_ids: List[str], embeddings: List[List[float]]) -> bool:
+    @_synchronized
+    def add_vectors(self, vector_ids: List[str], embeddings: Union[List[List[float]], np.ndarray]) -> bool:
         """
         Add vectors to the FAISS index.
 
@@ -68,37 +317,204 @@ class FaissIndexManager:
             True if successful
         """
         try:
-            if not vector_ids or not embeddings:
+            if not vector_ids or len(embeddings) == 0:
                 return False
 
             if len(vector_ids) != len(embeddings):
                 raise ValueError("Number of vector_ids must match number of embeddings")
 
-            # Normalize embeddings for cosine similarity
-            embeddings_array = np.array(embeddings, dtype=np.float32)
-            faiss.normalize_L2(embeddings_array)
+            # Copy into the staging buffer and normalize for cosine similarity
+            embeddings_array = self._staging_buffer(len(embeddings))
+            embeddings_array[:] = embeddings
+            self._normalize_rows(embeddings_array)
+
+            self._ensure_writable()
+
+            # An untrained index (e.g. a fresh IVF index) is trained on the
+            # first vectors it receives
+            if not self.index.is_trained:
+                self.index.train(embeddings_array)
 
-            # Get current index size before adding
-            start_index = self.index.ntotal
+            # Allocate int64 ids for the new vectors (the next list positions)
+            start_id = len(self._ids)
+            int_ids = np.arange(start_id, start_id + len(vector_ids), dtype=np.int64)
 
             # Add to FAISS index
-            self.index.add(embeddings_array)
+            self.index.add_with_ids(embeddings_array, int_ids)
+            self._mark_gpu_stale()
+
+            self.dirty += len(vector_ids)
+            self.version += 1
 
             # Update mappings
-            for i, vector_id in enumerate(vector_ids):
-                idx = start_index + i
-                self.id_to_index[vector_id] = idx
-                self.index_to_id[idx] = vector_id
+            self._ids.extend(vector_ids)
+            if self._id_to_index is not None:
+                self._id_to_index.update(zip(vector_ids, range(start_id, start_id + len(vector_ids))))
 
-            print(f"Added {len(vector_ids)} vectors to FAISS index (total: {self.index.ntotal})")
+            logger.debug("Added %d vectors to FAISS index (total: %d)", len(vector_ids), self.index.ntotal)
             return True
 
         except Exception as e:
-            print(f"Error adding vectors to FAISS index: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding vectors to FAISS index")
             return False
 
+    def _search_params(self, selector):
+        """
+        Build search parameters restricting results to the selected ids.
+
+        IVF and HNSW indexes only accept their own parameter types.
+
+        Args:
+            selector: FAISS IDSelector over our int64 ids
+
+        Returns:
+            SearchParameters instance for the current index type
+        """
+        try:
+            faiss.extract_index_ivf(self.index)
+            return faiss.SearchParametersIVF(sel=selector, nprobe=self.nprobe)
+        except RuntimeError:
+            pass
+
+        if isinstance(faiss.downcast_index(self.index.index), faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector)
+        return faiss.SearchParameters(sel=selector)
+
+    @_synchronized
+    def search_batch(
+        self,
+        query_embeddings: Union[List[List[float]], np.ndarray],
+        top_k: int = 10,
+        vector_ids_filter: Optional[List[str]] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Search for similar vectors for several queries in one FAISS call.
+
+        Args:
+            query_embeddings: Query embedding vectors, shape (nq, d)
+            top_k: Number of results to return per query
+            vector_ids_filter: Optional list of vector IDs to restrict results to
+
+        Returns:
+            One list of (vector_id, similarity_score) tuples per query,
+            sorted by similarity
+        """
+        # One copy into a float32 matrix, normalized in place for cosine similarity
+        queries = self._normalize_rows(np.array(query_embeddings, dtype=np.float32, ndmin=2))
+        return self._search_normalized(queries, top_k, vector_ids_filter)
+
+    def _search_normalized(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        vector_ids_filter: Optional[List[str]]
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Search with an already normalized float32 query matrix.
+
+        Args:
+            queries: Normalized query matrix, shape (nq, d)
+            top_k: Number of results to return per query
+            vector_ids_filter: Optional list of vector IDs to restrict results to
+
+        Returns:
+            One list of (vector_id, similarity_score) tuples per query
+        """
+        empty = [[] for _ in range(len(queries))]
+
+        if self.index.ntotal == 0:
+            logger.debug("FAISS index is empty")
+            return empty
+
+        k = min(top_k, self.index.ntotal)
+        if vector_ids_filter:
+            id_to_index = self.id_to_index
+            allowed = np.unique(np.fromiter(
+                (id_to_index[vid] for vid in vector_ids_filter if vid in id_to_index),
+                dtype=np.int64
+            ))
+            if allowed.size == 0:
+                return empty
+            k = min(top_k, int(allowed.size))
+            similarities, indices = self._search_filtered(queries, k, allowed)
+        else:
+            similarities, indices = self._run_search(queries, k, None)
+
+        # Drop FAISS's -1 padding with one vectorized mask per query, so the
+        # Python loop only maps real hits to vector ids
+        valid = indices >= 0
+        ids = self._ids
+        results = []
+        for query_similarities, query_indices, query_valid in zip(similarities, indices, valid):
+            hits = zip(query_indices[query_valid].tolist(), query_similarities[query_valid].tolist())
+            results.append([
+                (ids[idx], similarity) for idx, similarity in hits if ids[idx] is not None
+            ])
+
+        return results
+
+    def _search_filtered(self, queries: np.ndarray, k: int, allowed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search restricted to the given FAISS ids.
+
+        The filter is pushed into FAISS with an ID selector where the index
+        supports search parameters. Otherwise (e.g. IndexIDMap2 in the
+        pinned faiss-cpu 1.7.4) results are over-fetched and post-filtered.
+
+        Args:
+            queries: Normalized query matrix, shape (nq, d)
+            k: Number of results per query
+            allowed: Sorted unique FAISS ids to restrict results to
+
+        Returns:
+            Tuple of (similarities, indices), shape (nq, k), -1 padded
+        """
+        if self._selector_search:
+            try:
+                params = self._search_params(faiss.IDSelectorBatch(allowed))
+                return self._run_search(queries, k, params)
+            except RuntimeError as e:
+                logger.warning("FAISS index does not take ID selectors, post-filtering instead: %s", e)
+                self._selector_search = False
+
+        # Widen the search until every query has k allowed hits or the
+        # whole index was searched
+        ntotal = self.index.ntotal
+        search_k = min(ntotal, k * 10)
+        while True:
+            similarities, indices = self._run_search(queries, search_k, None)
+            keep = np.isin(indices, allowed)
+            if search_k >= ntotal or keep.sum(axis=1).min() >= k:
+                break
+            search_k = min(ntotal, search_k * 4)
+
+        # Move allowed hits to the front of each row, keeping their order
+        order = np.argsort(~keep, axis=1, kind="stable")[:, :k]
+        indices = np.where(
+            np.take_along_axis(keep, order, axis=1),
+            np.take_along_axis(indices, order, axis=1),
+            -1
+        )
+        return np.take_along_axis(similarities, order, axis=1), indices
+
+    def _run_search(self, queries: np.ndarray, k: int, params):
+        """
+        Run the FAISS search, on the GPU copy when possible.
+
+        Filtered searches stay on the CPU index since GPU indexes don't take
+        ID selectors; GPU errors also fall back to the CPU index.
+        """
+        if params is None and self._gpu_res is not None:
+            try:
+                if self._gpu_stale or self.gpu_index is None:
+                    self.to_gpu()
+                return self.gpu_index.search(queries, k)
+            except RuntimeError as e:
+                logger.warning("FAISS GPU search failed, using CPU index: %s", e)
+
+        return self.index.search(queries, k, params=params)
+
+    @_synchronized
     def search(
         self,
         query_embedding: List[float],
@@ -117,55 +533,18 @@ class FaissIndexManager:
             List of (vector_id, similarity_score) tuples sorted by similarity
         """
         try:
-            if self.index.ntotal == 0:
-                print("FAISS index is empty")
-                return []
-
-            # Normalize query for cosine similarity
             query_array = self.normalize_embedding(query_embedding)
-
-            # If filtering, need to search more and filter afterwards
-            search_k = top_k if not vector_ids_filter else min(self.index.ntotal, top_k * 10)
-
-            # Search FAISS index
-            similarities, indices = self.index.search(query_array, search_k)
-
-            # Convert to results
-            results = []
-            for i, idx in enumerate(indices[0]):
-                if idx == -1:  # FAISS returns -1 for empty results
-                    continue
-
-                vector_id = self.index_to_id.get(idx)
-                if vector_id is None:
-                    continue
-
-                # Apply filter if provided
-                if vector_ids_filter and vector_id not in vector_ids_filter:
-                    continue
-
-                similarity = float(similarities[0][i])
-                results.append((vector_id, similarity))
-
-                # Stop if we have enough results
-                if len(results) >= top_k:
-                    break
-
-            return results
+            return self._search_normalized(query_array, top_k, vector_ids_filter)[0]
 
         except Exception as e:
-            print(f"Error searching FAISS index: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error searching FAISS index")
             return []
 
+    @_synchronized
     def remove_vectors(self, vector_ids: List[str]) -> bool:
         """
         Remove vectors from the index.
 
-        Note: FAISS IndexFlatIP doesn't support direct removal, so we need to rebuild.
-        For small datasets this is acceptable; for large datasets consider using IndexIDMap.
-
         Args:
             vector_ids: List of vector IDs to remove
 
@@ -176,100 +555,149 @@ class FaissIndexManager:
             if not vector_ids:
                 return True
 
-            # Mark IDs for removal
-            ids_to_remove = set(vector_ids)
-
             # Check if any IDs exist
-            existing_ids = [vid for vid in vector_ids if vid in self.id_to_index]
+            id_to_index = self.id_to_index
+            existing_ids = [vid for vid in vector_ids if vid in id_to_index]
             if not existing_ids:
-                print(f"No vectors found to remove from {len(vector_ids)} requested")
+                logger.debug("No vectors found to remove from %d requested", len(vector_ids))
                 return True
 
-            print(f"Removing {len(existing_ids)} vectors from FAISS index (rebuilding required)")
-
-            # Rebuild index without removed vectors
-            # This is a limitation of IndexFlatIP - for large datasets, consider IndexIDMap
-            return self._rebuild_without_ids(ids_to_remove)
+            self._ensure_writable()
+            int_ids = np.asarray([id_to_index[vid] for vid in existing_ids], dtype=np.int64)
+            try:
+                removed = self.index.remove_ids(faiss.IDSelectorBatch(int_ids))
+            except RuntimeError:
+                # Some index types (e.g. HNSW) don't support removal
+                removed = self._rebuild_without_ids(int_ids)
+            self._mark_gpu_stale()
+            self.dirty += removed
+            self.version += 1
+
+            for vector_id, idx in zip(existing_ids, int_ids.tolist()):
+                del id_to_index[vector_id]
+                self._ids[idx] = None
+
+            logger.debug("Removed %d vectors from FAISS index (total: %d)", removed, self.index.ntotal)
+            return True
 
         except Exception as e:
-            print(f"Error removing vectors from FAISS index: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error removing vectors from FAISS index")
             return False
 
-    def _rebuild_without_ids(self, ids_to_remove: set) -> bool:
+    def _rebuild_without_ids(self, int_ids: np.ndarray) -> int:
         """
-        Rebuild index without specified IDs.
+        Rebuild the index without the given ids.
+
+        All stored vectors are read back with one reconstruct_n call on the
+        wrapped index and the kept rows are re-added in one batch.
 
         Args:
-            ids_to_remove: Set of vector IDs to exclude
+            int_ids: FAISS ids to drop
 
         Returns:
-            True if successful
+            Number of vectors removed
         """
-        try:
-            # Collect vectors to keep
-            vectors_to_keep = []
-            ids_to_keep = []
-
-            for vector_id, idx in self.id_to_index.items():
-                if vector_id not in ids_to_remove:
-                    # Extract vector from current index
-                    vector = self.index.reconstruct(int(idx))
-                    vectors_to_keep.append(vector)
-                    ids_to_keep.append(vector_id)
-
-            # Create new index
-            self.index = faiss.IndexFlatIP(self.embedding_dim)
-            self.id_to_index.clear()
-            self.index_to_id.clear()
-
-            # Add kept vectors
-            if vectors_to_keep:
-                vectors_array = np.array(vectors_to_keep, dtype=np.float32)
-                self.index.add(vectors_array)
-
-                for i, vector_id in enumerate(ids_to_keep):
-                    self.id_to_index[vector_id] = i
-                    self.index_to_id[i] = vector_id
-
-            print(f"Rebuilt FAISS index with {len(ids_to_keep)} vectors")
-            return True
+        inner = faiss.downcast_index(self.index.index)
+        if hasattr(inner, "make_direct_map"):
+            inner.make_direct_map()  # IVF indexes need it to reconstruct
 
-        except Exception as e:
-            print(f"Error rebuilding FAISS index: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
+        stored_ids = faiss.vector_to_array(self.index.id_map)
+        keep_mask = ~np.isin(stored_ids, int_ids)
+        kept = np.ascontiguousarray(inner.reconstruct_n(0, inner.ntotal)[keep_mask])
+
+        # The clone keeps trained parameters (e.g. IVF centroids)
+        index = faiss.clone_index(self.index)
+        index.reset()
+        index.add_with_ids(kept, stored_ids[keep_mask])
+        self._apply_search_params(index)
+        self.index = index
+
+        logger.info("Rebuilt FAISS index without %d vectors", len(stored_ids) - len(kept))
+        return len(stored_ids) - len(kept)
 
+    def should_save(self) -> bool:
+        """
+        Whether enough vectors changed since the last save to write the index.
+
+        Returns:
+            True once save_threshold changes have accumulated
+        """
+        return self.dirty > 0 and self.dirty >= self.save_threshold
+
+    @_synchronized
     def save(self) -> bool:
         """
         Save FAISS index and mappings to disk.
 
+        Both files are written to temporary paths, synced and then renamed
+        over the previous ones, so a crash never leaves a half-written file.
+        The two renames aren't atomic as a pair, so the id file records the
+        index's ntotal and load() rejects an index and id map that don't
+        belong together.
+
         Returns:
             True if successful
         """
         try:
-            # Save FAISS index
-            faiss.write_index(self.index, self.index_path)
-
-            # Save mappings
-            mappings_path = self.index_path + ".mappings"
-            with open(mappings_path, "wb") as f:
-                pickle.dump({
-                    "id_to_index": self.id_to_index,
-                    "index_to_id": self.index_to_id
-                }, f)
+            index_tmp = self.index_path + ".tmp"
+            ids_tmp = self._ids_path() + ".tmp"
 
-            print(f"Saved FAISS index to {self.index_path}")
+            # Save FAISS index
+            faiss.write_index(self.index, index_tmp)
+            with open(index_tmp, "rb+") as f:
+                os.fsync(f.fileno())
+
+            # Save vector_ids as one string array indexed by FAISS id
+            # (removed ids are stored as empty strings)
+            ids = np.array([vid or "" for vid in self._ids], dtype=str)
+            with open(ids_tmp, "wb") as f:
+                np.savez(f, ids=ids, ntotal=np.int64(self.index.ntotal))
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(index_tmp, self.index_path)
+            os.replace(ids_tmp, self._ids_path())
+
+            self.dirty = 0
+            logger.debug("Saved FAISS index to %s", self.index_path)
             return True
 
         except Exception as e:
-            print(f"Error saving FAISS index: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error saving FAISS index")
             return False
 
+    def _ids_path(self) -> str:
+        """Path of the saved id mapping arrays."""
+        return self.index_path + ".ids.npz"
+
+    @staticmethod
+    def _is_memory_mapped(index) -> bool:
+        """Whether faiss actually mapped the index file (only IVF lists are)."""
+        try:
+            ivf = faiss.extract_index_ivf(index)
+        except RuntimeError:
+            return False
+        return isinstance(faiss.downcast_InvertedLists(ivf.invlists), faiss.OnDiskInvertedLists)
+
+    def _read_index(self):
+        """
+        Read the index file, memory-mapping it where faiss supports it.
+
+        faiss only maps IVF inverted lists; flat and SQ indexes are read
+        into RAM even with IO_FLAG_MMAP and stay writable. Index types
+        that reject the flag (e.g. HNSW) are read normally.
+
+        Returns:
+            Tuple of (index, whether it is a read-only memory map)
+        """
+        try:
+            index = faiss.read_index(self.index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            return index, self._is_memory_mapped(index)
+        except RuntimeError as e:
+            logger.warning("FAISS index can't be memory-mapped, reading into memory: %s", e)
+            return faiss.read_index(self.index_path), False
+
+    @_synchronized
     def load(self) -> bool:
         """
         Load FAISS index and mappings from disk.
@@ -279,95 +707,224 @@ class FaissIndexManager:
         """
         try:
             if not Path(self.index_path).exists():
-                print(f"No existing FAISS index found at {self.index_path}")
+                logger.info("No existing FAISS index found at %s", self.index_path)
                 return False
 
-            # Load FAISS index
-            self.index = faiss.read_index(self.index_path)
-
-            # Load mappings
+            # Load FAISS index; mapped IVF lists load pages on demand
+            index, self._readonly = self._read_index()
+            if not isinstance(index, faiss.IndexIDMap2):
+                # Legacy flat index: vector positions were the ids, so keep
+                # them as explicit ids and the saved mappings stay valid
+                index = self._convert_legacy_index(index)
+                self._readonly = False
+            self._apply_search_params(index)
+            self.index = index
+
+            # Load mappings, falling back to the legacy pickled dicts
             mappings_path = self.index_path + ".mappings"
-            if Path(mappings_path).exists():
+            if Path(self._ids_path()).exists():
+                with np.load(self._ids_path()) as data:
+                    if "ntotal" in data and int(data["ntotal"]) != self.index.ntotal:
+                        raise ValueError(
+                            f"FAISS id map is for {int(data['ntotal'])} vectors, "
+                            f"index has {self.index.ntotal}"
+                        )
+                    if "ids" in data:
+                        self._reset_ids([vid or None for vid in data["ids"].tolist()])
+                    else:
+                        # Earlier layout of parallel (FAISS id, vector_id) arrays
+                        self._reset_ids(self._ids_from_pairs(
+                            data["faiss_ids"].tolist(), data["vector_ids"].tolist()
+                        ))
+            elif Path(mappings_path).exists():
                 with open(mappings_path, "rb") as f:
                     mappings = pickle.load(f)
-                    self.id_to_index = mappings["id_to_index"]
-                    # Convert keys to int for index_to_id
-                    self.index_to_id = {int(k): v for k, v in mappings["index_to_id"].items()}
-
-            print(f"Loaded FAISS index from {self.index_path} ({self.index.ntotal} vectors)")
+                index_to_id = mappings["index_to_id"]
+                self._reset_ids(self._ids_from_pairs(
+                    [int(k) for k in index_to_id.keys()], list(index_to_id.values())
+                ))
+
+            # A crash between save()'s two renames can pair a new index with
+            # an old id map; every FAISS id must have an entry
+            if self.index.ntotal:
+                max_id = int(faiss.vector_to_array(self.index.id_map).max())
+                if max_id >= len(self._ids):
+                    raise ValueError(
+                        f"FAISS id map has {len(self._ids)} entries, index uses id {max_id}"
+                    )
+
+            logger.info("Loaded FAISS index from %s (%d vectors)", self.index_path, self.index.ntotal)
             return True
 
         except Exception as e:
-            print(f"Error loading FAISS index: {e}")
+            # The caller rebuilds an empty index from the database
+            logger.error("Error loading FAISS index: %s", e)
             # Start fresh if loading fails
-            self.index = faiss.IndexFlatIP(self.embedding_dim)
-            self.id_to_index.clear()
-            self.index_to_id.clear()
+            self.index = self._new_index()
+            self._readonly = False
+            self._reset_ids()
             return False
 
-    def build_from_database(self, db_connection) -> bool:
+    @staticmethod
+    def _ids_from_pairs(faiss_ids: List[int], vector_ids: List[str]) -> List[Optional[str]]:
+        """
+        Build the position-indexed id list from (FAISS id, vector_id) pairs.
+
+        Args:
+            faiss_ids: FAISS ids
+            vector_ids: Matching vector ids
+
+        Returns:
+            List with vector_id at each FAISS id and None for unused ids
+        """
+        ids: List[Optional[str]] = [None] * (max(faiss_ids, default=-1) + 1)
+        for idx, vector_id in zip(faiss_ids, vector_ids):
+            ids[idx] = vector_id
+        return ids
+
+    def _convert_legacy_index(self, flat_index):
+        """
+        Wrap a legacy position-addressed flat index in an IndexIDMap2.
+
+        Args:
+            flat_index: Index whose vector positions were used as ids
+
+        Returns:
+            IndexIDMap2 holding the same vectors with id == old position
+        """
+        # Legacy indexes were always exact flat indexes, so stay flat
+        index = faiss.IndexIDMap2(faiss.IndexFlatIP(self.embedding_dim))
+        if flat_index.ntotal > 0:
+            vectors = flat_index.reconstruct_n(0, flat_index.ntotal)
+            index.add_with_ids(vectors, np.arange(flat_index.ntotal, dtype=np.int64))
+        logger.info("Converted legacy FAISS index (%d vectors) to IndexIDMap2", flat_index.ntotal)
+        return index
+
+    def reserve(self, n_total: int):
+        """
+        Pre-size the index storage for n_total vectors.
+
+        Avoids repeated geometric reallocation while adding in chunks.
+        Best effort: only code storage is reserved (faiss-cpu 1.7.4 doesn't
+        expose reserve on the id map), and only for index types with a
+        codes vector.
+
+        Args:
+            n_total: Total number of vectors the index will hold
+        """
+        self._ensure_writable()
+        flat = faiss.downcast_index(self.index.index)
+        codes = getattr(flat, "codes", None)
+        if codes is not None and hasattr(codes, "reserve"):
+            codes.reserve(n_total * flat.code_size)
+
+    def _staging_buffer(self, n: int) -> np.ndarray:
+        """
+        Get an (n, d) float32 view of the reusable add buffer.
+
+        The buffer grows geometrically, so steady-state ingestion reuses
+        the same allocation.
+
+        Args:
+            n: Number of rows needed
+
+        Returns:
+            Writable float32 matrix of shape (n, embedding_dim)
+        """
+        if self._add_buffer is None or len(self._add_buffer) < n:
+            rows = max(n, 2 * len(self._add_buffer) if self._add_buffer is not None else 0)
+            self._add_buffer = np.empty((rows, self.embedding_dim), dtype=np.float32)
+        return self._add_buffer[:n]
+
+    @_synchronized
+    def build_from_database(self, db_connection, chunk_size: int = 8192) -> bool:
         """
         Build FAISS index from existing vectors in database.
 
+        Rows are streamed in chunks so only chunk_size embeddings are
+        decoded in memory at a time.
+
         Args:
             db_connection: DatabaseConnection instance
+            chunk_size: Number of rows decoded and added per chunk
 
         Returns:
             True if successful
         """
         try:
-            print("Building FAISS index from database vectors...")
+            logger.info("Building FAISS index from database vectors...")
 
-            # Fetch all vectors with embeddings
+            total = db_connection.fetchone("""
+                SELECT COUNT(*) as count FROM vectors WHERE embedding IS NOT NULL
+            """)["count"]
+
+            if not total:
+                logger.info("No vectors found in database")
+                return True
+
+            # Indexes like IVF need training on a random sample first
+            if not self.index.is_trained:
+                sample_rows = db_connection.fetchall("""
+                    SELECT embedding FROM vectors
+                    WHERE embedding IS NOT NULL
+                    ORDER BY RANDOM()
+                    LIMIT ?
+                """, (self._training_size(),))
+                sample = np.empty((len(sample_rows), self.embedding_dim), dtype=np.float32)
+                for i, row in enumerate(sample_rows):
+                    sample[i] = decode_embedding(row["embedding"])
+                if not self.train(sample):
+                    logger.warning("FAISS index training failed")
+                    return False
+
+            self.reserve(self.index.ntotal + total)
+
+            # Fetch vectors with embeddings chunk by chunk
             query = """
                 SELECT id, embedding
                 FROM vectors
                 WHERE embedding IS NOT NULL
                 ORDER BY id
             """
-            rows = db_connection.fetchall(query)
-
-            if not rows:
-                print("No vectors found in database")
+            added = 0
+
+            for rows in db_connection.iterchunks(query, size=chunk_size):
+                # Decode straight into one preallocated float32 matrix per chunk
+                vector_ids = []
+                embeddings = np.empty((len(rows), self.embedding_dim), dtype=np.float32)
+
+                for row in rows:
+                    vector_id = row["id"]
+                    embedding_blob = row["embedding"]
+
+                    if not embedding_blob:
+                        continue
+
+                    # Decode embedding
+                    try:
+                        embeddings[len(vector_ids)] = decode_embedding(embedding_blob)
+                        vector_ids.append(vector_id)
+                    except Exception as e:
+                        logger.warning("Error decoding embedding for vector %s: %s", vector_id, e)
+                        continue
+
+                # Add to index (normalized and added in one call per chunk)
+                if vector_ids and self.add_vectors(vector_ids, embeddings[:len(vector_ids)]):
+                    added += len(vector_ids)
+
+            if added:
+                # Save index
+                self.save()
+                logger.info("Successfully built FAISS index with %d vectors", added)
                 return True
 
-            # Collect vectors
-            vector_ids = []
-            embeddings = []
-
-            for row in rows:
-                vector_id = row["id"]
-                embedding_blob = row["embedding"]
-
-                if not embedding_blob:
-                    continue
-
-                # Decode embedding
-                try:
-                    embedding = json.loads(embedding_blob.decode('utf-8'))
-                    vector_ids.append(vector_id)
-                    embeddings.append(embedding)
-                except Exception as e:
-                    print(f"Error decoding embedding for vector {vector_id}: {e}")
-                    continue
-
-            # Add to index
-            if vector_ids and embeddings:
-                success = self.add_vectors(vector_ids, embeddings)
-                if success:
-                    # Save index
-                    self.save()
-                    print(f"Successfully built FAISS index with {len(vector_ids)} vectors")
-                    return True
-
             return False
 
         except Exception as e:
-            print(f"Error building FAISS index from database: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error building FAISS index from database")
             return False
 
+    @_synchronized
     def clear(self) -> bool:
         """
         Clear the index completely.
@@ -376,12 +933,15 @@ class FaissIndexManager:
             True if successful
         """
         try:
-            self.index = faiss.IndexFlatIP(self.embedding_dim)
-            self.id_to_index.clear()
-            self.index_to_id.clear()
-            print("Cleared FAISS index")
+            self.dirty += max(self.index.ntotal, 1)
+            self.version += 1
+            self.index = self._new_index()
+            self._readonly = False
+            self._reset_ids()
+            self._mark_gpu_stale()
+            logger.info("Cleared FAISS index")
             return True
 
         except Exception as e:
-            print(f"Error clearing FAISS index: {e}")
+            logger.error("Error clearing FAISS index: %s", e)
             return False
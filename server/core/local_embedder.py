@@ -0,0 +1,60 @@
+"""
+In-process embedding with FastEmbed (ONNX Runtime).
+
+Optional alternative to Ollama for embeddings, selected with
+LOCAL_BRAIN_EMBEDDING_PROVIDER=fastembed. Requires `pip install fastembed`.
+"""
+import logging
+import threading
+from typing import List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class LocalEmbedder:
+    """Embeds texts with a FastEmbed model loaded in this process."""
+
+    def __init__(self, model_name: str, batch_size: int = 64):
+        try:
+            from fastembed import TextEmbedding
+        except ImportError as e:
+            raise ImportError(
+                "The fastembed embedding provider requires the fastembed package "
+                "(pip install fastembed)"
+            ) from e
+
+        self.model_name = model_name
+        self.batch_size = batch_size
+        logger.info("Loading FastEmbed model %s", model_name)
+        self.model = TextEmbedding(model_name=model_name)
+        # onnxruntime sessions may not be entered concurrently
+        self._lock = threading.Lock()
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts in batched ONNX forward passes.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Float32 matrix of shape (len(texts), d)
+        """
+        with self._lock:
+            vectors = list(self.model.embed(texts, batch_size=self.batch_size))
+        return np.asarray(vectors, dtype=np.float32)
+
+
+# Singleton local embedder (the model is loaded on first use)
+_local_embedder: Optional[LocalEmbedder] = None
+_local_embedder_lock = threading.Lock()
+
+
+def get_local_embedder(model_name: str) -> LocalEmbedder:
+    """Get or create the singleton local embedder."""
+    global _local_embedder
+    with _local_embedder_lock:
+        if _local_embedder is None:
+            _local_embedder = LocalEmbedder(model_name)
+    return _local_embedder
@@ -4,6 +4,7 @@ Automatic database migration management.
 Handles running Alembic migrations automatically on application startup.
 """
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 from alembic.config import Config
@@ -12,6 +13,7 @@ from alembic.script import ScriptDirectory
 from alembic.runtime.migration import MigrationContext
 
 
+@lru_cache(maxsize=1)
 def get_alembic_config() -> Config:
     """Get Alembic configuration with correct paths for both dev and PyInstaller."""
     # Handle both development and PyInstaller bundle
@@ -34,11 +36,17 @@ def get_alembic_config() -> Config:
     return config
 
 
+@lru_cache(maxsize=4)
+def _get_engine(db_path: str):
+    """Get a cached SQLAlchemy engine for the database file."""
+    from sqlalchemy import create_engine
+    return create_engine(f"sqlite:///{db_path}")
+
+
 def get_current_revision(db_path: str) -> Optional[str]:
     """Get the current database revision, or None if not initialized."""
     try:
-        from sqlalchemy import create_engine
-        engine = create_engine(f"sqlite:///{db_path}")
+        engine = _get_engine(db_path)
 
         with engine.connect() as connection:
             context = MigrationContext.configure(connection)
@@ -49,6 +57,7 @@ def get_current_revision(db_path: str) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=1)
 def get_head_revision() -> str:
     """Get the head (latest) migration revision."""
     config = get_alembic_config()
@@ -56,6 +65,13 @@ def get_head_revision() -> str:
     return script.get_current_head()
 
 
+def clear_caches():
+    """Drop the cached Alembic config, head revision and engines."""
+    get_alembic_config.cache_clear()
+    get_head_revision.cache_clear()
+    _get_engine.cache_clear()
+
+
 def needs_migration(db_path: str) -> bool:
     """Check if database needs migration."""
     current = get_current_revision(db_path)
@@ -103,10 +119,11 @@ def auto_migrate(db_path: str, force: bool = False) -> bool:
         True if successful or no migration needed, False on error
     """
     try:
-        if force or needs_migration(db_path):
-            current = get_current_revision(db_path)
-            head = get_head_revision()
+        # Resolve both revisions once rather than again after needs_migration
+        current = get_current_revision(db_path)
+        head = get_head_revision()
 
+        if force or current is None or current != head:
             if current is None:
                 print(f"📦 Initializing new database with schema revision {head}...")
             else:
@@ -122,7 +139,6 @@ def auto_migrate(db_path: str, force: bool = False) -> bool:
                 return False
         else:
             # No migration needed
-            current = get_current_revision(db_path)
             print(f"✓ Database is up to date (revision: {current})")
             return True
 
@@ -3,10 +3,76 @@ Ollama HTTP client for embeddings and chat completions.
 
 Provides a clean interface to interact with the Ollama API.
 """
+import asyncio
+import logging
+import httpx
+import numpy as np
+import orjson
+import re
 import requests
+import threading
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
 from .config import get_settings
+from .database import get_db_connection
+from .embedding_cache import EmbeddingCache
+from .local_embedder import get_local_embedder
+
+logger = logging.getLogger(__name__)
+
+# Matches embedding-only model names ("embedding" contains "embed")
+_EMBED_RE = re.compile(r"embed", re.IGNORECASE)
+
+# Texts per /api/embed request: the default, and the sizes autotuning tries
+DEFAULT_BATCH_SIZE = 16
+BATCH_SIZE_CANDIDATES = (8, 16, 32, 64)
+
+
+class AdaptiveLimit:
+    """
+    AIMD concurrency limit for embedding batches.
+
+    A failed batch (e.g. Ollama returning 500 under memory pressure) halves
+    the limit; each run of `limit` consecutive successes raises it by one,
+    up to the configured maximum. Successes never wait.
+    """
+
+    def __init__(self, maximum: int):
+        self.maximum = maximum
+        self.limit = maximum
+        self._successes = 0
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def record(self, ok: bool):
+        """Adjust the limit after a batch finished."""
+        with self._cond:
+            if ok:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            else:
+                if self.limit > 1:
+                    logger.warning("Embedding concurrency reduced to %d after a failed batch", self.limit // 2)
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            self._cond.notify_all()
+
+    def acquire(self):
+        """Block the calling thread until a slot under the current limit is free."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self, ok: bool):
+        """Free a slot taken with acquire() and record the outcome."""
+        with self._cond:
+            self._in_flight -= 1
+        self.record(ok)
 
 
 class OllamaClient:
@@ -16,11 +82,139 @@ class OllamaClient:
         settings = get_settings()
         self.base_url = base_url or settings.ollama_base_url
         self.embedding_model = embedding_model or settings.ollama_embedding_model
+
+        # Optional in-process FastEmbed model used instead of Ollama for
+        # embeddings (loaded on first use). Cached vectors are keyed by the
+        # model that produced them, so switching providers never mixes them.
+        self.local_embedding = settings.embedding_provider == "fastembed"
+        self.fastembed_model = settings.fastembed_model
+        self.embedding_key = (
+            f"fastembed/{self.fastembed_model}" if self.local_embedding else self.embedding_model
+        )
+        self.embedding_dim = settings.embedding_dimensions
         self.timeout = settings.ollama_timeout
+        self.concurrency = max(1, settings.ollama_concurrency)
+        self.limiter = AdaptiveLimit(self.concurrency)
+        # Batch size per (embedding model, text length bucket), see _atune_batch_size
+        self._tuned_batch_sizes: Dict[Tuple[str, int], int] = {}
+        self.cache_enabled = settings.embedding_cache_enabled
+        self._cache: Optional[EmbeddingCache] = None
+
+        # Per-client LRU over (model, text) so repeated queries skip both
+        # Ollama and SQLite; vectors are stored as read-only arrays
+        self._memo_embedding = lru_cache(maxsize=settings.embedding_memo_size)(self._embed_uncached)
+
+        # One pooled keep-alive session for every Ollama call. Embedding
+        # requests retry in their own loops, and pull/chat POSTs must not be
+        # re-sent, so the adapter itself never retries.
+        adapter = HTTPAdapter(pool_maxsize=max(32, self.concurrency))
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Bodies are pre-serialized with orjson, so the type is set once here
+        self.session.headers["Content-Type"] = "application/json"
+
+        # Async counterpart for callers running on the event loop. Every
+        # pooled connection is kept alive (httpx keeps 20 by default) so
+        # embedding fan-out bursts reuse sockets instead of reconnecting.
+        # HTTP/1.1 only: Ollama serves plain HTTP, where httpx has no HTTP/2.
+        max_connections = max(32, self.concurrency)
+        self.aclient = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            headers={"Content-Type": "application/json"}
+        )
+
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self.session.close()
+
+    async def aclose(self):
+        """Close both the async and the blocking HTTP connection pools."""
+        await self.aclient.aclose()
+        self.close()
+
+    def __enter__(self) -> "OllamaClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        """Embedding cache on the app database, or None when disabled."""
+        if self._cache is None and self.cache_enabled:
+            self._cache = EmbeddingCache(get_db_connection())
+        return self._cache
+
+    def prune_cache(self, max_age_days: float) -> int:
+        """
+        Drop cached embeddings older than max_age_days.
+
+        Args:
+            max_age_days: Maximum entry age in days
 
-    def generate_embedding(self, text: str, max_retries: int = 3) -> List[float]:
+        Returns:
+            Number of entries deleted
         """
-        Generate embedding for a single text string with retry logic.
+        cache = self.cache
+        if cache is None:
+            return 0
+        return cache.prune(max_age_days)
+
+    def generate_embedding(self, text: str, max_retries: int = 3) -> np.ndarray:
+        """
+        Generate embedding for a single text string, using the embedding cache.
+
+        Recent texts are answered from an in-process LRU before the SQLite
+        cache is consulted.
+
+        Args:
+            text: Text to generate embedding for
+            max_retries: Maximum number of retry attempts (default: 3)
+
+        Returns:
+            Read-only float32 embedding vector (768 dimensions), shared
+            with the LRU
+
+        Raises:
+            Exception: If embedding generation fails after all retries
+        """
+        return self._memo_embedding(self.embedding_key, text, max_retries)
+
+    def _embed_uncached(self, model: str, text: str, max_retries: int = 3) -> np.ndarray:
+        """
+        Embed one text via the SQLite cache or Ollama, bypassing the LRU.
+
+        Args:
+            model: Embedding model name (part of the LRU key)
+            text: Text to generate embedding for
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            Read-only float32 embedding vector
+
+        Raises:
+            Exception: If embedding generation fails after all retries
+        """
+        cache = self.cache
+        embedding = cache.get(model, text) if cache is not None else None
+
+        if embedding is None:
+            embedding = np.asarray(self._request_embedding(text, max_retries), dtype=np.float32)
+            if cache is not None:
+                cache.set(model, text, embedding)
+
+        embedding.setflags(write=False)
+        return embedding
+
+    def _request_embedding(self, text: str, max_retries: int = 3) -> List[float]:
+        """
+        Request an embedding for a single text from Ollama with retry logic.
 
         Args:
             text: Text to generate embedding for
@@ -32,32 +226,40 @@ class OllamaClient:
         Raises:
             Exception: If embedding generation fails after all retries
         """
+        if self.local_embedding:
+            return get_local_embedder(self.fastembed_model).embed([text])[0]
+
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/api/embeddings",
-                    json={
+                    data=orjson.dumps({
                         "model": self.embedding_model,
                         "prompt": text
-                    },
+                    }),
                     timeout=30
                 )
 
                 # Log response details if error occurs
                 if response.status_code != 200:
-                    print(f"❌ Ollama returned {response.status_code} (attempt {attempt + 1}/{max_retries})")
-                    print(f"Response body: {response.text}")
-                    print(f"Text length: {len(text)} chars")
-                    print(f"Text preview: {text[:200]}..." if len(text) > 200 else f"Text: {repr(text)}")
+                    logger.warning("Ollama returned %d (attempt %d/%d)", response.status_code, attempt + 1, max_retries)
+                    # Diagnostic details are only built when debug logging is on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Response body: %s", response.text)
+                        logger.debug("Text length: %d chars", len(text))
+                        if len(text) > 200:
+                            logger.debug("Text preview: %s...", text[:200])
+                        else:
+                            logger.debug("Text: %r", text)
 
                 response.raise_for_status()
-                result = response.json()
+                result = orjson.loads(response.content)
 
                 # Success - return embedding
                 if attempt > 0:
-                    print(f"✅ Embedding succeeded on retry {attempt + 1}")
+                    logger.info("Embedding succeeded on retry %d", attempt + 1)
                 return result.get("embedding", [])
 
             except Exception as e:
@@ -66,57 +268,424 @@ class OllamaClient:
                 if attempt < max_retries - 1:
                     # Exponential backoff: 1s, 2s, 4s
                     wait_time = 2 ** attempt
-                    print(f"⚠️ Embedding failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s...")
+                    logger.warning("Embedding failed (attempt %d/%d), retrying in %ds...",
+                                   attempt + 1, max_retries, wait_time)
                     time.sleep(wait_time)
                 else:
                     # Final attempt failed
-                    print(f"❌ Embedding failed after {max_retries} attempts: {e}")
+                    logger.error("Embedding failed after %d attempts: %s", max_retries, e)
 
         # All retries exhausted
         raise Exception(f"Failed to generate embedding after {max_retries} attempts: {str(last_error)}")
 
+    def _embed_batch(self, texts: List[str], max_retries: int = 3) -> List[List[float]]:
+        """
+        Embed several texts in one request to Ollama's /api/embed endpoint.
+
+        Failed requests are retried with the same exponential backoff as
+        single embeddings. Ollama versions without /api/embed (404) fall
+        back to one /api/embeddings request per text.
+
+        Args:
+            texts: Text strings to embed
+            max_retries: Maximum number of attempts per batch (default: 3)
+
+        Returns:
+            Embedding vectors in the same order as texts
+
+        Raises:
+            Exception: If the batch fails after all retries
+        """
+        if self.local_embedding:
+            return get_local_embedder(self.fastembed_model).embed(texts)
+
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/api/embed",
+                    data=orjson.dumps({
+                        "model": self.embedding_model,
+                        "input": texts
+                    }),
+                    timeout=self.timeout
+                )
+                if response.status_code == 404:
+                    logger.warning("Ollama has no /api/embed endpoint, embedding texts one at a time")
+                    return [self._request_embedding(text, max_retries) for text in texts]
+
+                response.raise_for_status()
+                result = orjson.loads(response.content)
+                if "embeddings" not in result:
+                    logger.warning("Ollama /api/embed response has no embeddings, embedding texts one at a time")
+                    return [self._request_embedding(text, max_retries) for text in texts]
+
+                embeddings = result["embeddings"]
+                if len(embeddings) != len(texts):
+                    raise Exception(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+                return embeddings
+
+            except Exception as e:
+                last_error = e
+
+                if attempt < max_retries - 1:
+                    # Exponential backoff: 1s, 2s, 4s
+                    wait_time = 2 ** attempt
+                    logger.warning("Embedding batch failed (attempt %d/%d), retrying in %ds...",
+                                   attempt + 1, max_retries, wait_time)
+                    time.sleep(wait_time)
+
+        raise Exception(f"Failed to embed batch after {max_retries} attempts: {str(last_error)}")
+
+    def _prepare_batch(self, texts: List[str]) -> Tuple[List[str], List[int], list, List[int]]:
+        """
+        Deduplicate texts and fill what the embedding cache already has.
+
+        Args:
+            texts: Text strings to embed
+
+        Returns:
+            Tuple of (unique texts, index into them for each input text,
+            embeddings per unique text, indices of unique texts still missing)
+        """
+        # Map each text to its first occurrence so duplicates are embedded once
+        unique: Dict[str, int] = {}
+        order = [unique.setdefault(text, len(unique)) for text in texts]
+        unique_texts = list(unique)
+
+        total = len(unique_texts)
+        if total < len(texts):
+            logger.debug("Skipping %d duplicate chunks", len(texts) - total)
+        embeddings: list = [[] for _ in range(total)]
+
+        # Serve repeated chunks from the cache and only send the misses
+        cache = self.cache
+        missing = list(range(total))
+        if cache is not None:
+            missing = []
+            for i, cached in enumerate(cache.get_many(self.embedding_key, unique_texts)):
+                if cached is not None:
+                    embeddings[i] = cached
+                else:
+                    missing.append(i)
+            if total - len(missing):
+                logger.debug("Embedding cache hits: %d/%d", total - len(missing), total)
+
+        # Send texts shortest first so each batch holds similar lengths and
+        # the server pads less; _finish_batch scatters results back by index
+        missing.sort(key=lambda i: len(unique_texts[i]))
+
+        return unique_texts, order, embeddings, missing
+
+    def _finish_batch(
+        self,
+        texts: List[str],
+        unique_texts: List[str],
+        order: List[int],
+        embeddings: list,
+        missing: List[int],
+        generated: List[List[float]]
+    ) -> np.ndarray:
+        """
+        Store generated embeddings in the cache and stack them in input order.
+
+        Args:
+            texts: Original input texts
+            unique_texts: Deduplicated texts
+            order: Index into unique_texts for each input text
+            embeddings: Embeddings per unique text (cache hits filled)
+            missing: Indices of unique texts that were sent to Ollama
+            generated: Embeddings returned for the missing texts, in order
+
+        Returns:
+            Float32 matrix of shape (len(texts), d); rows that failed are zero
+        """
+        for i, embedding in zip(missing, generated):
+            embeddings[i] = embedding
+
+        cache = self.cache
+        if cache is not None:
+            cache.set_many(self.embedding_key, ((unique_texts[i], embeddings[i]) for i in missing))
+
+        # One contiguous matrix per unique text, then gathered into input
+        # order with a single fancy-indexing copy (duplicates included)
+        dim = next((len(e) for e in embeddings if len(e)), self.embedding_dim)
+        matrix = np.zeros((len(unique_texts), dim), dtype=np.float32)
+        succeeded = 0
+        for i, embedding in enumerate(embeddings):
+            if len(embedding) == dim:
+                matrix[i] = embedding
+                succeeded += 1
+
+        total = len(unique_texts)
+        logger.info("Generated %d/%d embeddings (%d cached, %d duplicates)",
+                    succeeded, total, total - len(missing), len(texts) - total)
+
+        return matrix[np.asarray(order, dtype=np.intp)]
+
     def generate_embeddings_batch(
         self,
         texts: List[str],
-        batch_size: int = 5,
-        delay: float = 0.5
-    ) -> List[List[float]]:
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> np.ndarray:
         """
-        Generate embeddings for multiple texts in batches with retry logic.
+        Generate embeddings for multiple texts using concurrent batch requests.
+
+        Duplicate texts are embedded once. The remaining texts are split into
+        batches sent to /api/embed, with up to settings.ollama_concurrency
+        batches in flight at once.
 
         Args:
             texts: List of text strings to generate embeddings for
-            batch_size: Number of texts to process in each batch (default: 5)
-            delay: Delay in seconds between embeddings to allow GPU recovery (default: 0.5s)
+            batch_size: Number of texts sent in each request (default: 16)
 
         Returns:
-            List of embedding vectors
+            Float32 matrix of shape (len(texts), d) aligned with texts; rows
+            that failed are all zero
         """
-        embeddings = []
-        total = len(texts)
+        unique_texts, order, embeddings, missing = self._prepare_batch(texts)
 
-        print(f"Generating embeddings for {total} chunks in batches of {batch_size}...")
+        missing_texts = [unique_texts[i] for i in missing]
+        batches = [missing_texts[i:i + batch_size] for i in range(0, len(missing_texts), batch_size)]
 
-        for i in range(0, total, batch_size):
-            batch = texts[i:i + batch_size]
-            batch_end = min(i + batch_size, total)
+        logger.debug("Generating embeddings for %d chunks in %d batches of %d (%d concurrent)",
+                     len(missing_texts), len(batches), batch_size, self.concurrency)
 
-            print(f"Processing batch {i // batch_size + 1}/{(total + batch_size - 1) // batch_size} "
-                  f"(chunks {i + 1}-{batch_end})")
+        def embed(batch_number: int) -> List[List[float]]:
+            batch = batches[batch_number]
+            self.limiter.acquire()
+            ok = False
+            try:
+                result = self._embed_batch(batch)
+                ok = True
+                return result
+            except Exception as e:
+                logger.error("Error generating embeddings for batch %d/%d: %s", batch_number + 1, len(batches), e)
+                # Return empty lists on error to maintain index alignment
+                return [[] for _ in batch]
+            finally:
+                self.limiter.release(ok)
+
+        generated = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            # map yields in submission order, keeping results aligned with texts
+            for batch_embeddings in executor.map(embed, range(len(batches))):
+                generated.extend(batch_embeddings)
 
-            for text in batch:
-                try:
-                    embedding = self.generate_embedding(text)
-                    embeddings.append(embedding)
-                    # Delay to allow Ollama GPU memory recovery between requests
-                    time.sleep(delay)
-                except Exception as e:
-                    print(f"Error generating embedding for chunk: {e}")
-                    # Return empty list on error to maintain index alignment
-                    embeddings.append([])
+        return self._finish_batch(texts, unique_texts, order, embeddings, missing, generated)
+
+    async def _aembed_batch(self, texts: List[str], max_retries: int = 3) -> List[List[float]]:
+        """
+        Async version of _embed_batch using the shared httpx client.
 
-        print(f"Generated {len([e for e in embeddings if e])} embeddings successfully")
-        return embeddings
+        Args:
+            texts: Text strings to embed
+            max_retries: Maximum number of attempts per batch (default: 3)
+
+        Returns:
+            Embedding vectors in the same order as texts
+
+        Raises:
+            Exception: If the batch fails after all retries
+        """
+        if self.local_embedding:
+            # ONNX inference is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(get_local_embedder(self.fastembed_model).embed, texts)
+
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                response = await self.aclient.post(
+                    "/api/embed",
+                    content=orjson.dumps({
+                        "model": self.embedding_model,
+                        "input": texts
+                    })
+                )
+                if response.status_code == 404:
+                    result = {}
+                else:
+                    response.raise_for_status()
+                    result = orjson.loads(response.content)
+
+                if "embeddings" not in result:
+                    # Older Ollama without a batch /api/embed: use the blocking per-text path
+                    return await asyncio.to_thread(
+                        lambda: [self._request_embedding(text, max_retries) for text in texts]
+                    )
+
+                embeddings = result["embeddings"]
+
+                if len(embeddings) != len(texts):
+                    raise Exception(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+                return embeddings
+
+            except Exception as e:
+                last_error = e
+
+                if attempt < max_retries - 1:
+                    # Exponential backoff: 1s, 2s, 4s
+                    wait_time = 2 ** attempt
+                    logger.warning("Embedding batch failed (attempt %d/%d), retrying in %ds...",
+                                   attempt + 1, max_retries, wait_time)
+                    await asyncio.sleep(wait_time)
+
+        raise Exception(f"Failed to embed batch after {max_retries} attempts: {str(last_error)}")
+
+    async def _atune_batch_size(self, texts: List[str]) -> Tuple[int, List[List[float]]]:
+        """
+        Pick the request size with the best throughput for texts like these.
+
+        Sends consecutive slices of texts as one request per candidate size
+        and compares seconds per character, so the slices (which come sorted
+        by length) are compared fairly. The winner is remembered per model
+        and typical text length, so later jobs skip calibration.
+
+        Args:
+            texts: Texts still to embed; the calibration requests embed a
+                prefix of them
+
+        Returns:
+            Tuple of (batch size, embeddings for the prefix of texts that
+            calibration embedded)
+        """
+        avg_len = sum(map(len, texts)) // max(1, len(texts))
+        key = (self.embedding_key, min(avg_len // 500, 8))
+        if key in self._tuned_batch_sizes:
+            return self._tuned_batch_sizes[key], []
+
+        generated: List[List[float]] = []
+        costs: Dict[int, float] = {}
+        for size in BATCH_SIZE_CANDIDATES:
+            sample = texts[len(generated):len(generated) + size]
+            if len(sample) < size:
+                break
+
+            start = time.perf_counter()
+            try:
+                result = await self._aembed_batch(sample)
+                costs[size] = (time.perf_counter() - start) / max(1, sum(map(len, sample)))
+            except Exception as e:
+                logger.error("Error generating embeddings for calibration batch of %d: %s", size, e)
+                result = [[] for _ in sample]
+            generated.extend(result)
+
+        if len(costs) < 2:
+            # Too few texts to compare sizes; use the default without caching
+            return DEFAULT_BATCH_SIZE, generated
+
+        best = min(costs, key=costs.get)
+        self._tuned_batch_sizes[key] = best
+        logger.info("Embedding batch size tuned to %d for ~%d-char texts", best, avg_len)
+        return best, generated
+
+    async def agenerate_embeddings_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Async version of generate_embeddings_batch.
+
+        Batches are sent concurrently with asyncio.gather, at most
+        settings.ollama_concurrency at a time, without blocking the event loop.
+
+        Args:
+            texts: List of text strings to generate embeddings for
+            batch_size: Number of texts sent in each request (default: tuned
+                by _atune_batch_size)
+
+        Returns:
+            Float32 matrix of shape (len(texts), d) aligned with texts; rows
+            that failed are all zero
+        """
+        # The cache lookup and write are SQLite calls that can wait on the
+        # write lock, so both run off the event loop
+        unique_texts, order, embeddings, missing = await asyncio.to_thread(self._prepare_batch, texts)
+
+        missing_texts = [unique_texts[i] for i in missing]
+        calibrated: List[List[float]] = []
+        if batch_size is None:
+            batch_size, calibrated = await self._atune_batch_size(missing_texts)
+            missing_texts = missing_texts[len(calibrated):]
+        batches = [missing_texts[i:i + batch_size] for i in range(0, len(missing_texts), batch_size)]
+        # Batches in flight are gated by the shared adaptive limit
+        cond = asyncio.Condition()
+        in_flight = 0
+
+        async def embed(batch_number: int) -> List[List[float]]:
+            nonlocal in_flight
+            batch = batches[batch_number]
+            async with cond:
+                await cond.wait_for(lambda: in_flight < self.limiter.limit)
+                in_flight += 1
+
+            ok = False
+            try:
+                result = await self._aembed_batch(batch)
+                ok = True
+                return result
+            except Exception as e:
+                logger.error("Error generating embeddings for batch %d/%d: %s", batch_number + 1, len(batches), e)
+                return [[] for _ in batch]
+            finally:
+                self.limiter.record(ok)
+                async with cond:
+                    in_flight -= 1
+                    cond.notify_all()
+
+        # gather returns results in submission order
+        generated = calibrated
+        for batch_embeddings in await asyncio.gather(*(embed(i) for i in range(len(batches)))):
+            generated.extend(batch_embeddings)
+
+        return await asyncio.to_thread(
+            self._finish_batch, texts, unique_texts, order, embeddings, missing, generated
+        )
+
+    async def warm_up(self, chat_model: Optional[str] = None) -> bool:
+        """
+        Load models in Ollama ahead of the first real request.
+
+        The embedding model and, if given, the chat model are loaded
+        concurrently, which also opens pooled connections to Ollama.
+
+        Args:
+            chat_model: Chat model to load as well
+
+        Returns:
+            True if every model answered
+        """
+        warmups = [self._warm_up_embedding()]
+        if chat_model:
+            warmups.append(self._warm_up_chat(chat_model))
+        return all(await asyncio.gather(*warmups))
+
+    async def _warm_up_embedding(self) -> bool:
+        """Send a one-word /api/embed request, bypassing the caches."""
+        try:
+            await self._aembed_batch(["warmup"], max_retries=1)
+            logger.info("Embedding model %s is loaded", self.embedding_key)
+            return True
+        except Exception as e:
+            logger.warning("Could not warm up embedding model %s: %s", self.embedding_key, e)
+            return False
+
+    async def _warm_up_chat(self, model: str) -> bool:
+        """Send an empty /api/generate prompt, which loads the model without generating."""
+        try:
+            response = await self.aclient.post(
+                "/api/generate",
+                content=orjson.dumps({"model": model, "prompt": "", "stream": False})
+            )
+            response.raise_for_status()
+            logger.info("Chat model %s is loaded", model)
+            return True
+        except Exception as e:
+            logger.warning("Could not warm up chat model %s: %s", model, e)
+            return False
 
     def check_model_available(self, model_name: Optional[str] = None) -> bool:
         """
@@ -130,9 +699,9 @@ class OllamaClient:
         """
         model = model_name or self.embedding_model
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
-            models = response.json().get("models", [])
+            models = orjson.loads(response.content).get("models", [])
 
             for m in models:
                 if m.get("name", "").startswith(model):
@@ -140,7 +709,7 @@ class OllamaClient:
 
             return False
         except Exception as e:
-            print(f"Error checking model availability: {e}")
+            logger.error("Error checking model availability: %s", e)
             return False
 
     def pull_model(self, model_name: Optional[str] = None) -> Dict:
@@ -155,10 +724,10 @@ class OllamaClient:
         """
         model = model_name or self.embedding_model
         try:
-            print(f"Pulling {model} model...")
-            response = requests.post(
+            logger.info("Pulling %s model...", model)
+            response = self.session.post(
                 f"{self.base_url}/api/pull",
-                json={"name": model},
+                data=orjson.dumps({"name": model}),
                 timeout=300  # 5 minutes for download
             )
             response.raise_for_status()
@@ -187,20 +756,20 @@ class OllamaClient:
             Exception: If chat generation fails
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/chat",
-                json={
+                data=orjson.dumps({
                     "model": model,
                     "messages": messages,
                     "stream": stream
-                },
+                }),
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             return result.get("message", {}).get("content", "")
         except Exception as e:
-            print(f"Error generating chat response: {e}")
+            logger.error("Error generating chat response: %s", e)
             raise Exception(f"Failed to generate chat response: {str(e)}")
 
     def list_models(self) -> List[Dict]:
@@ -211,11 +780,11 @@ class OllamaClient:
             List of model dictionaries
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
-            return response.json().get("models", [])
+            return orjson.loads(response.content).get("models", [])
         except Exception as e:
-            print(f"Error listing models: {e}")
+            logger.error("Error listing models: %s", e)
             return []
 
     def list_chat_models(self) -> List[str]:
@@ -233,12 +802,12 @@ class OllamaClient:
             for model in models:
                 model_name = model.get("name", "")
                 # Exclude embedding-only models
-                if not any(embed in model_name.lower() for embed in ["embed", "embedding"]):
+                if not _EMBED_RE.search(model_name):
                     chat_models.append(model_name)
 
             return chat_models
         except Exception as e:
-            print(f"Error listing chat models: {e}")
+            logger.error("Error listing chat models: %s", e)
             return []
 
 
@@ -252,3 +821,11 @@ def get_ollama_client() -> OllamaClient:
     if _ollama_client is None:
         _ollama_client = OllamaClient()
     return _ollama_client
+
+
+async def close_ollama_client():
+    """Close the singleton Ollama client's pooled connections."""
+    global _ollama_client
+    if _ollama_client is not None:
+        await _ollama_client.aclose()
+        _ollama_client = None
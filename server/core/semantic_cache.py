@@ -0,0 +1,129 @@
+"""
+Centroid-based semantic cache for near-duplicate queries.
+
+Keeps one unit-norm centroid per cluster of similar query embeddings, each
+with a cached result. A query whose cosine similarity to a centroid exceeds
+the threshold reuses that result instead of recomputing it.
+"""
+import threading
+from typing import Any, Hashable, List, Optional
+import numpy as np
+from .config import get_settings
+
+
+class SemanticCache:
+    """Fixed-size cache of results keyed by query embedding similarity."""
+
+    def __init__(self, max_entries: int = 256, threshold: float = 0.86):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, version: Optional[int]):
+        """Drop every entry and remember the data version they belong to."""
+        self.version = version
+        self.centroids: Optional[np.ndarray] = None  # (max_entries, d), unit-norm rows
+        self.counts = np.zeros(self.max_entries, dtype=np.int64)
+        self.keys: List[Optional[Hashable]] = [None] * self.max_entries
+        self.values: List[Any] = [None] * self.max_entries
+        self.size = 0
+        self._next = 0  # Slot overwritten next once the cache is full
+
+    @staticmethod
+    def _unit(embedding) -> Optional[np.ndarray]:
+        """Return embedding as a unit-norm float32 vector, or None if zero."""
+        q = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(q)
+        return q / norm if norm > 0 else None
+
+    def lookup(self, embedding, key: Hashable, version: int) -> Optional[Any]:
+        """
+        Find a cached result for a similar query.
+
+        A hit moves the matched centroid toward the query (running mean).
+
+        Args:
+            embedding: Query embedding
+            key: Other parameters the result depends on; only equal keys match
+            version: Current version of the underlying data; a change
+                invalidates every entry
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        q = self._unit(embedding)
+        if q is None:
+            return None
+
+        with self._lock:
+            if version != self.version:
+                self._reset(version)
+                return None
+            if not self.size or self.centroids.shape[1] != len(q):
+                return None
+
+            sims = self.centroids[:self.size] @ q
+            for i, entry_key in enumerate(self.keys[:self.size]):
+                if entry_key != key:
+                    sims[i] = -np.inf
+
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+
+            count = self.counts[best]
+            centroid = self.centroids[best] * count + q
+            self.centroids[best] = centroid / np.linalg.norm(centroid)
+            self.counts[best] = count + 1
+            return self.values[best]
+
+    def add(self, embedding, key: Hashable, value: Any, version: int):
+        """
+        Start a new cluster for a query that missed.
+
+        The oldest cluster is replaced once the cache is full.
+
+        Args:
+            embedding: Query embedding
+            key: Other parameters the result depends on
+            value: Result to cache
+            version: Version of the underlying data the result was computed on
+        """
+        q = self._unit(embedding)
+        if q is None or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            if version != self.version or self.centroids is None or self.centroids.shape[1] != len(q):
+                self._reset(version)
+                self.centroids = np.zeros((self.max_entries, len(q)), dtype=np.float32)
+
+            slot = self._next
+            self.centroids[slot] = q
+            self.counts[slot] = 1
+            self.keys[slot] = key
+            self.values[slot] = value
+            self._next = (slot + 1) % self.max_entries
+            self.size = min(self.size + 1, self.max_entries)
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._reset(None)
+
+
+# Singleton semantic cache for search results
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get or create the singleton search result cache."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        settings = get_settings()
+        _semantic_cache = SemanticCache(
+            max_entries=settings.semantic_cache_size,
+            threshold=settings.semantic_cache_threshold
+        )
+    return _semantic_cache
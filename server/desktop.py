@@ -5,8 +5,6 @@ Creates a native desktop window with embedded webview to run Murmur Brain
 import os
 import sys
 import threading
-import time
-import socket
 from pathlib import Path
 import webview
 import uvicorn
@@ -17,45 +15,26 @@ sys.path.insert(0, str(Path(__file__).parent))
 from main import app
 from bridge import DesktopBridge
 from core.config import get_settings
+from core.network import find_free_port, uvicorn_speedups, wait_for_server
 
 
-def find_free_port(start_port=8000, max_attempts=100):
-    """Find an available port starting from start_port."""
-    for port in range(start_port, start_port + max_attempts):
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('127.0.0.1', port))
-                return port
-        except OSError:
-            continue
-    raise RuntimeError(f"Could not find free port in range {start_port}-{start_port + max_attempts}")
-
-
-def start_backend_server(port: int):
-    """Start the FastAPI backend server in a separate thread."""
+def create_backend_server(port: int) -> uvicorn.Server:
+    """Create the uvicorn server for the FastAPI backend."""
     config = uvicorn.Config(
         app,
         host="127.0.0.1",
         port=port,
-        log_level="info",
-        access_log=False  # Reduce console noise
+        # Release (PyInstaller) builds only log problems
+        log_level="warning" if getattr(sys, "frozen", False) else "info",
+        access_log=False,  # Reduce console noise
+        **uvicorn_speedups()
     )
-    server = uvicorn.Server(config)
-    server.run()
+    return uvicorn.Server(config)
 
 
-def wait_for_server(port: int, timeout: int = 10):
-    """Wait for the backend server to be ready."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                s.connect(('127.0.0.1', port))
-                return True
-        except (socket.timeout, ConnectionRefusedError):
-            time.sleep(0.1)
-    return False
+def start_backend_server(server: uvicorn.Server):
+    """Run the backend server until main() sets server.should_exit."""
+    server.run()
 
 
 def check_ollama_on_startup():
@@ -84,16 +63,17 @@ def main():
     settings = get_settings()
 
     # Find an available port
-    port = find_free_port(8000)
+    port = find_free_port()
     api_url = f"http://127.0.0.1:{port}"
 
     print(f"Starting {settings.app_name} v{settings.app_version}...")
     print(f"Backend server will run on: {api_url}")
 
     # Start backend server in a separate thread
+    server = create_backend_server(port)
     backend_thread = threading.Thread(
         target=start_backend_server,
-        args=(port,),
+        args=(server,),
         daemon=True
     )
     backend_thread.start()
@@ -106,8 +86,8 @@ def main():
 
     print("Backend server is ready!")
 
-    # Check Ollama status on startup (non-blocking)
-    check_ollama_on_startup()
+    # Check Ollama status on startup without delaying the window
+    threading.Thread(target=check_ollama_on_startup, daemon=True).start()
 
     # Create JavaScript bridge
     bridge = DesktopBridge(port=port, api_url=api_url)
@@ -145,6 +125,11 @@ def main():
     print(f"DevTools enabled - Right-click and select 'Inspect' to open developer tools")
     webview.start(debug=True)  # Debug mode enables DevTools
 
+    # Stop the backend gracefully so shutdown handlers (e.g. saving the
+    # FAISS index) run before the process exits
+    server.should_exit = True
+    backend_thread.join(timeout=10)
+
     print(f"{settings.app_name} closed.")
     sys.exit(0)
 
@@ -3,11 +3,16 @@ Murmur Brain API - Main application entry point.
 
 A modular FastAPI application for RAG-based document Q&A using local Ollama models.
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pathlib import Path
+import asyncio
+import gzip
+import hashlib
+import logging
 import os
 import sys
 
@@ -20,12 +25,20 @@ from modules.health.health_controller import router as health_router
 
 # Import core services for lifecycle management
 from core.database import get_db_connection, close_db_connection
+from core.ollama_client import get_ollama_client, close_ollama_client
 from core.config import get_settings
+from core.dependencies import get_ollama_service
 
 
 # Initialize settings
 settings = get_settings()
 
+# Hot paths (FAISS, embedding batches) log through the logging module
+logging.basicConfig(
+    level=logging.DEBUG if settings.debug else logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
@@ -42,6 +55,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses (document lists, search results, chat histories)
+# for clients that accept gzip; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -60,23 +77,59 @@ async def startup_event():
         print("⚠️  Warning: Database migrations failed. App may not work correctly.")
         print("   You can manually run migrations with: python3 server/migrate.py up")
 
+    # Load the embedding and chat models in the background so the first
+    # upload, search or message doesn't wait for Ollama's cold start
+    # (reference kept on app.state)
+    chat_model = settings.ollama_default_chat_model if settings.ollama_warm_up_chat else None
+    app.state.warm_task = asyncio.create_task(get_ollama_client().warm_up(chat_model))
+
+    # Expire old embedding cache entries
+    if migration_success and settings.embedding_cache_max_age_days > 0:
+        pruned = get_ollama_client().prune_cache(settings.embedding_cache_max_age_days)
+        if pruned:
+            print(f"Pruned {pruned} expired embedding cache entries")
+
     # Initialize FAISS index from database
-    from core.dependencies import get_faiss_manager
+    from core.dependencies import get_faiss_manager, init_services
     print("\n🔍 Initializing FAISS vector search index...")
     faiss_manager = get_faiss_manager()
 
-    # If no existing index, build from database
+    # Vectors of documents deleted before deletes removed them explicitly
+    # would otherwise keep the counts below from ever matching
+    if migration_success:
+        orphaned = db.execute(
+            "DELETE FROM vectors WHERE doc_id NOT IN (SELECT id FROM documents)"
+        ).rowcount
+        db.commit()
+        if orphaned:
+            print(f"Removed {orphaned} vectors of deleted documents")
+
+    # Saves are batched, so an index left behind by a crash can miss recent
+    # changes; rebuild whenever it disagrees with the database
+    vector_count = db.fetchone(
+        "SELECT COUNT(*) as count FROM vectors WHERE embedding IS NOT NULL"
+    )["count"]
     if faiss_manager.index.ntotal == 0:
         print("No existing FAISS index found, building from database vectors...")
         faiss_manager.build_from_database(db)
+    elif faiss_manager.index.ntotal != vector_count:
+        print(f"FAISS index has {faiss_manager.index.ntotal} vectors but database has {vector_count}, rebuilding...")
+        faiss_manager.clear()
+        faiss_manager.build_from_database(db)
     else:
         print(f"✓ Loaded existing FAISS index with {faiss_manager.index.ntotal} vectors")
 
+    # Repositories and services are shared by every request
+    init_services()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     print(f"Shutting down {settings.app_name}...")
+    from core.dependencies import close_faiss_manager
+    close_faiss_manager()
+    await close_ollama_client()
     close_db_connection()
 
 
@@ -91,11 +144,8 @@ app.include_router(ollama_router)      # /api/ollama/*
 @app.get("/api/chat/models")
 async def get_chat_models_legacy():
     """Legacy endpoint - redirects to /api/ollama/chat/models"""
-    from modules.ollama.ollama_service import OllamaService
-    from core.ollama_client import get_ollama_client
-
     try:
-        service = OllamaService(get_ollama_client())
+        service = get_ollama_service()
         models = service.get_chat_models()
         return {
             "success": True,
@@ -123,21 +173,58 @@ print(f"Dist exists: {dist_path.exists()}")
 if dist_path.exists():
     print(f"Index.html exists: {(dist_path / 'index.html').exists()}")
 
-# Mount static assets if dist exists
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed build output, cached by browsers for a year."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+# Mount static assets if dist exists. Vite puts a content hash in every
+# asset file name, so browsers never need to revalidate them.
 if dist_path.exists() and (dist_path / "assets").exists():
     print(f"Serving static files from: {dist_path}")
-    app.mount("/assets", StaticFiles(directory=str(dist_path / "assets")), name="assets")
+    app.mount("/assets", ImmutableStaticFiles(directory=str(dist_path / "assets")), name="assets")
+
+# index.html is served for every frontend route, so it is read and
+# gzip-compressed once instead of on each request
+index_path = dist_path / "index.html"
+INDEX_HTML = index_path.read_bytes() if index_path.exists() else None
+INDEX_HTML_GZ = gzip.compress(INDEX_HTML, 9) if INDEX_HTML is not None else None
+INDEX_ETAG = f'"{hashlib.blake2b(INDEX_HTML, digest_size=16).hexdigest()}"' if INDEX_HTML is not None else None
+
 
-# Frontend catch-all route - MUST be last to not override API routes
+# index.html names the current asset hashes, so it is always revalidated
+INDEX_HEADERS = {"Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+
+
+# Frontend catch-all route - MUST be last to not override API routes.
+# StaticFiles(html=True) only falls back to index.html for directories, so
+# client-side routes still need this handler.
 @app.get("/{full_path:path}")
-async def serve_spa(full_path: str = ""):
+async def serve_spa(request: Request, full_path: str = ""):
     """Serve the React SPA for all non-API routes."""
     # Don't serve frontend for API routes
     if full_path.startswith("api"):
         raise HTTPException(status_code=404, detail="API endpoint not found")
 
     # Serve index.html for all frontend routes (SPA catch-all)
-    index_path = dist_path / "index.html"
+    if INDEX_HTML is not None:
+        headers = {**INDEX_HEADERS, "ETag": INDEX_ETAG}
+        # Revalidation of an unchanged build needs no body
+        if INDEX_ETAG in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(
+                INDEX_HTML_GZ,
+                media_type="text/html",
+                headers={**headers, "Content-Encoding": "gzip"}
+            )
+        return Response(INDEX_HTML, media_type="text/html", headers=headers)
+
+    # Frontend built after the server started
     if index_path.exists():
         return FileResponse(index_path)
 
@@ -145,30 +232,17 @@ async def serve_spa(full_path: str = ""):
     raise HTTPException(status_code=404, detail="Frontend not built. Run 'pnpm build' first.")
 
 
-def find_free_port(start_port=8000):
-    """Find a free port starting from start_port."""
-    import socket
-    port = start_port
-    while port < start_port + 100:  # Try up to 100 ports
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('127.0.0.1', port))
-                return port
-        except OSError:
-            port += 1
-    raise RuntimeError(f"Could not find a free port in range {start_port}-{start_port + 100}")
-
-
 if __name__ == "__main__":
     import uvicorn
+    from core.network import find_free_port, uvicorn_speedups
 
     # Get port from environment variable or find a free one
     port = int(os.environ.get('API_PORT', 0))
     if port == 0:
-        port = find_free_port(8000)
+        port = find_free_port()
 
     print(f"Starting server on http://127.0.0.1:{port}")
     print("Press CTRL+C to quit")
     print("\nNOTE: For desktop app, run: python3 server/desktop.py")
 
-    uvicorn.run(app, host="127.0.0.1", port=port)
+    uvicorn.run(app, host="127.0.0.1", port=port, **uvicorn_speedups())
@@ -8,6 +8,57 @@ import sys
 import subprocess
 from pathlib import Path
 
+try:
+    from alembic import command
+    from alembic.util import CommandError
+    from core.migrations import get_alembic_config
+except ImportError:
+    command = None
+
+
+def run_alembic(name: str, *args, **kwargs) -> int:
+    """
+    Run an Alembic command in this process.
+
+    Calls alembic.command directly instead of spawning the alembic CLI,
+    saving an interpreter start per command.
+
+    Args:
+        name: alembic.command function name (e.g. "upgrade")
+        *args: Positional arguments after the config
+        **kwargs: Keyword arguments for the command
+
+    Returns:
+        Exit code (0 on success)
+    """
+    try:
+        getattr(command, name)(get_alembic_config(), *args, **kwargs)
+        return 0
+    except CommandError as e:
+        print(f"Error: {e}")
+        return 1
+    except Exception as e:
+        print(f"Error running migration command: {e}")
+        return 1
+
+
+def alembic_command(name: str, cli_args: list[str], *args, **kwargs) -> int:
+    """
+    Run an Alembic command in process, or via the CLI if Alembic can't be imported.
+
+    Args:
+        name: alembic.command function name
+        cli_args: Equivalent alembic CLI arguments for the fallback
+        *args: Positional arguments for the in-process command
+        **kwargs: Keyword arguments for the in-process command
+
+    Returns:
+        Exit code from the command
+    """
+    if command is not None:
+        return run_alembic(name, *args, **kwargs)
+    return run_alembic_command(cli_args)
+
 
 def run_alembic_command(args: list[str]) -> int:
     """
@@ -85,25 +136,25 @@ def main():
 
     elif command == "up":
         print("Running pending migrations...")
-        return run_alembic_command(["upgrade", "head"])
+        return alembic_command("upgrade", ["upgrade", "head"], "head")
 
     elif command == "down":
         print("Rolling back last migration...")
-        return run_alembic_command(["downgrade", "-1"])
+        return alembic_command("downgrade", ["downgrade", "-1"], "-1")
 
     elif command == "status":
         print("Current migration status:")
-        return run_alembic_command(["current", "-v"])
+        return alembic_command("current", ["current", "-v"], verbose=True)
 
     elif command == "history":
         print("Migration history:")
-        return run_alembic_command(["history", "-v"])
+        return alembic_command("history", ["history", "-v"], verbose=True)
 
     elif command == "current":
-        return run_alembic_command(["current"])
+        return alembic_command("current", ["current"])
 
     elif command == "heads":
-        return run_alembic_command(["heads"])
+        return alembic_command("heads", ["heads"])
 
     elif command == "new":
         if len(sys.argv) < 3:
@@ -113,7 +164,7 @@ def main():
 
         message = " ".join(sys.argv[2:])
         print(f"Creating new migration: {message}")
-        return run_alembic_command(["revision", "-m", message])
+        return alembic_command("revision", ["revision", "-m", message], message=message)
 
     else:
         print(f"Error: Unknown command '{command}'")
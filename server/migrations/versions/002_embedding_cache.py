@@ -0,0 +1,38 @@
+"""Add embedding cache table
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+
+Creates the embedding_cache table:
+- embedding_cache: Content-addressed embeddings keyed by hash(model, text)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create embedding cache table."""
+
+    op.create_table(
+        'embedding_cache',
+        sa.Column('key', sa.LargeBinary(), nullable=False),
+        sa.Column('model', sa.Text(), nullable=False),
+        sa.Column('vector', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index('idx_embedding_cache_model', 'embedding_cache', ['model'])
+
+
+def downgrade() -> None:
+    """Drop embedding cache table."""
+    op.drop_index('idx_embedding_cache_model', table_name='embedding_cache')
+    op.drop_table('embedding_cache')
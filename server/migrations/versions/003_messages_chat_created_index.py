@@ -0,0 +1,32 @@
+"""Add covering index for per-chat message ordering and aggregates
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+Replaces idx_messages_chat_id with a (chat_id, created_at, id) index:
+- get_all's COUNT(m.id) / MAX(m.created_at) per chat read only the index
+- get_by_chat_id's ORDER BY created_at needs no sort
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the covering messages index and drop the chat_id-only one."""
+    op.create_index('idx_messages_chat_id_created_at', 'messages', ['chat_id', 'created_at', 'id'])
+    # Its columns are a prefix of the new index
+    op.drop_index('idx_messages_chat_id', table_name='messages')
+
+
+def downgrade() -> None:
+    """Restore the chat_id-only messages index."""
+    op.create_index('idx_messages_chat_id', 'messages', ['chat_id'])
+    op.drop_index('idx_messages_chat_id_created_at', table_name='messages')
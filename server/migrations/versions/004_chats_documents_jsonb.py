@@ -0,0 +1,35 @@
+"""Store chats.documents as SQLite JSONB
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+Rewrites the documents array into SQLite's binary JSON format (3.45+), so
+json_each / json_extract on the hot chat paths skip parsing text. SQLite
+stores values by type regardless of the declared column type, so the
+column is left as declared. On older SQLite this migration is a no-op
+and the repository keeps writing text JSON.
+"""
+import sqlite3
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+JSONB_SUPPORTED = sqlite3.sqlite_version_info >= (3, 45, 0)
+
+
+def upgrade() -> None:
+    """Convert existing documents arrays to JSONB."""
+    if JSONB_SUPPORTED:
+        op.execute("UPDATE chats SET documents = jsonb(documents) WHERE documents IS NOT NULL")
+
+
+def downgrade() -> None:
+    """Convert documents arrays back to text JSON."""
+    if JSONB_SUPPORTED:
+        op.execute("UPDATE chats SET documents = json(documents) WHERE documents IS NOT NULL")
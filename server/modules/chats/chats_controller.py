@@ -3,56 +3,19 @@ Chat API controller.
 
 FastAPI routes for chat management.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from typing import List
-from .chats_model import ChatRepository, ChatCreate, ChatResponse, ChatWithMessages, ChatTitleUpdate, DocumentLink
+from .chats_model import ChatCreate, ChatResponse, ChatWithMessages, ChatTitleUpdate, DocumentLink
 from .chats_service import ChatService
-from modules.messages.messages_model import MessageRepository, MessageCreate, ChatMessageResponse
-from modules.search.search_model import VectorRepository
-from modules.search.search_service import SearchService
-from core.dependencies import get_db, get_ollama, get_faiss
-from core.database import DatabaseConnection
-from core.ollama_client import OllamaClient
-from core.faiss_manager import FaissIndexManager
+from modules.messages.messages_model import MessageCreate, ChatMessageResponse
+from core.dependencies import get_chat_service
 
 
 router = APIRouter(prefix="/api/chats", tags=["chats"])
 
 
-def get_chat_repository(db: DatabaseConnection = Depends(get_db)) -> ChatRepository:
-    """Dependency that provides chat repository."""
-    return ChatRepository(db)
-
-
-def get_message_repository(db: DatabaseConnection = Depends(get_db)) -> MessageRepository:
-    """Dependency that provides message repository."""
-    return MessageRepository(db)
-
-
-def get_vector_repository(db: DatabaseConnection = Depends(get_db)) -> VectorRepository:
-    """Dependency that provides vector repository."""
-    return VectorRepository(db)
-
-
-def get_search_service(
-    vector_repo: VectorRepository = Depends(get_vector_repository),
-    ollama: OllamaClient = Depends(get_ollama),
-    faiss_manager: FaissIndexManager = Depends(get_faiss)
-) -> SearchService:
-    """Dependency that provides search service."""
-    return SearchService(vector_repo, ollama, faiss_manager)
-
-
-def get_chat_service(
-    chat_repo: ChatRepository = Depends(get_chat_repository),
-    message_repo: MessageRepository = Depends(get_message_repository),
-    search_service: SearchService = Depends(get_search_service),
-    ollama: OllamaClient = Depends(get_ollama)
-) -> ChatService:
-    """Dependency that provides chat service."""
-    return ChatService(chat_repo, message_repo, search_service, ollama)
-
-
 @router.post("", response_model=dict)
 async def create_chat(
     request: ChatCreate,
@@ -79,10 +42,11 @@ async def get_chats(service: ChatService = Depends(get_chat_service)):
     """Get all chats with metadata."""
     try:
         chats = service.get_all_chats()
-        return {
+        # Serialized once by orjson, skipping FastAPI's jsonable_encoder pass
+        return ORJSONResponse({
             "success": True,
             "chats": [chat.model_dump() for chat in chats]
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -97,11 +61,12 @@ async def get_chat(
         chat = service.get_chat(chat_id)
         if chat:
             chat_dict = chat.model_dump()
-            return {
+            messages = chat_dict.pop('messages')
+            return ORJSONResponse({
                 "success": True,
-                "chat": {k: v for k, v in chat_dict.items() if k != 'messages'},
-                "messages": chat_dict['messages']
-            }
+                "chat": chat_dict,
+                "messages": messages
+            })
         else:
             raise HTTPException(status_code=404, detail="Chat not found")
     except HTTPException:
@@ -159,7 +124,10 @@ async def send_message(
         if not request.message or not request.message.strip():
             raise HTTPException(status_code=400, detail="Message cannot be empty")
 
-        result = service.generate_response(chat_id, request.message.strip(), request.model)
+        # RAG search and generation block for seconds; run them in a worker thread
+        result = await asyncio.to_thread(
+            service.generate_response, chat_id, request.message.strip(), request.model
+        )
 
         if result["success"]:
             return ChatMessageResponse(**result)
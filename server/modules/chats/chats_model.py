@@ -5,11 +5,23 @@ Defines Pydantic schemas for chat API and database repository for chat operation
 """
 import uuid
 import json
+import sqlite3
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 from core.database import BaseRepository, DatabaseConnection
 
+# chats.documents is stored as binary JSONB where SQLite supports it
+# (3.45+, see migration 004) and as JSON text otherwise. The JSON1
+# functions read either form; writes and API reads go through these.
+if sqlite3.sqlite_version_info >= (3, 45, 0):
+    _JSON_STORE, _JSON_GROUP_ARRAY = "jsonb", "jsonb_group_array"
+else:
+    _JSON_STORE, _JSON_GROUP_ARRAY = "json", "json_group_array"
+
+# Chat columns with documents rendered back to JSON text for clients
+_CHAT_COLUMNS = "id, title, json(documents) AS documents, created_at, updated_at"
+
 
 # ============ Pydantic Schemas ============
 
@@ -53,12 +65,16 @@ class ChatRepository(BaseRepository):
     def __init__(self, db: DatabaseConnection):
         super().__init__(db)
 
-    def create(self, title: Optional[str] = None) -> str:
+    def create(self, title: Optional[str] = None, doc_ids: Optional[List[str]] = None) -> str:
         """
         Create a new chat session.
 
+        Linked documents are written with the row itself, so creating a
+        chat is a single INSERT however many documents it starts with.
+
         Args:
             title: Optional chat title
+            doc_ids: Optional document IDs to link
 
         Returns:
             Chat ID
@@ -67,27 +83,32 @@ class ChatRepository(BaseRepository):
             Exception: If chat creation fails
         """
         chat_id = str(uuid.uuid4())
-        self.db.execute("""
-            INSERT INTO chats (id, title)
-            VALUES (?, ?)
-        """, (chat_id, title))
+        created_at = datetime.now().isoformat()
+        documents = json.dumps([
+            {"document_id": doc_id, "created_at": created_at}
+            for doc_id in dict.fromkeys(doc_ids or [])
+        ])
+        self.db.execute(f"""
+            INSERT INTO chats (id, title, documents)
+            VALUES (?, ?, {_JSON_STORE}(?))
+        """, (chat_id, title, documents))
         self.db.commit()
 
         return chat_id
 
     def get_by_id(self, chat_id: str) -> Optional[Dict[str, Any]]:
         """Get chat by ID."""
-        row = self.db.fetchone("""
-            SELECT * FROM chats WHERE id = ?
+        row = self.db.fetchone(f"""
+            SELECT {_CHAT_COLUMNS} FROM chats WHERE id = ?
         """, (chat_id,))
 
-        return self._dict_from_row(row)
+        return row
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all chats with message count and last message timestamp."""
         rows = self.db.fetchall("""
             SELECT
-                c.*,
+                c.id, c.title, json(c.documents) AS documents, c.created_at, c.updated_at,
                 COUNT(m.id) as message_count,
                 MAX(m.created_at) as last_message_at
             FROM chats c
@@ -96,7 +117,7 @@ class ChatRepository(BaseRepository):
             ORDER BY c.updated_at DESC
         """)
 
-        return self._dicts_from_rows(rows)
+        return rows
 
     def delete(self, chat_id: str) -> bool:
         """
@@ -140,33 +161,48 @@ class ChatRepository(BaseRepository):
         Raises:
             ValueError: If chat not found
         """
-        # Get current documents array
-        row = self.db.fetchone("""
-            SELECT documents FROM chats WHERE id = ?
-        """, (chat_id,))
+        return self.link_documents(chat_id, [doc_id])
 
-        if not row:
-            raise ValueError("Chat not found")
+    def link_documents(self, chat_id: str, doc_ids: List[str]) -> bool:
+        """
+        Link several documents to a chat in one UPDATE.
 
-        # Parse existing documents
-        current_docs = json.loads(row[0] or '[]')
+        The array is edited inside SQLite with JSON1 functions, so it is
+        never parsed or re-serialized in Python.
 
-        # Check if document is already linked
-        if any(doc['document_id'] == doc_id for doc in current_docs):
-            return True  # Already linked
+        Args:
+            chat_id: Chat ID
+            doc_ids: Document IDs; already linked ones are skipped
 
-        # Add new document with timestamp
-        current_docs.append({
-            "document_id": doc_id,
-            "created_at": datetime.now().isoformat()
-        })
+        Returns:
+            True if successful
 
-        # Update the chat
-        self.db.execute("""
-            UPDATE chats SET documents = ? WHERE id = ?
-        """, (json.dumps(current_docs), chat_id))
+        Raises:
+            ValueError: If chat not found
+        """
+        # Existing entries first, then new ones in the given order
+        result = self.db.execute(f"""
+            UPDATE chats SET documents = (
+                SELECT {_JSON_GROUP_ARRAY}(json(value)) FROM (
+                    SELECT 0 AS part, e.key, e.value
+                    FROM json_each(COALESCE(chats.documents, '[]')) e
+                    UNION ALL
+                    SELECT 1, n.key, json_object('document_id', n.value, 'created_at', ?)
+                    FROM json_each(?) n
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM json_each(COALESCE(chats.documents, '[]')) e
+                        WHERE json_extract(e.value, '$.document_id') = n.value
+                    )
+                    ORDER BY part, key
+                )
+            )
+            WHERE id = ?
+        """, (datetime.now().isoformat(), json.dumps(list(dict.fromkeys(doc_ids))), chat_id))
         self.db.commit()
 
+        if result.rowcount == 0:
+            raise ValueError("Chat not found")
+
         return True
 
     def unlink_document(self, chat_id: str, doc_id: str) -> bool:
@@ -183,26 +219,20 @@ class ChatRepository(BaseRepository):
         Raises:
             ValueError: If chat not found
         """
-        # Get current documents array
-        row = self.db.fetchone("""
-            SELECT documents FROM chats WHERE id = ?
-        """, (chat_id,))
+        # Filter out the document to unlink inside SQLite
+        result = self.db.execute(f"""
+            UPDATE chats SET documents = (
+                SELECT {_JSON_GROUP_ARRAY}(json(value))
+                FROM json_each(COALESCE(chats.documents, '[]'))
+                WHERE json_extract(value, '$.document_id') IS NOT ?
+            )
+            WHERE id = ?
+        """, (doc_id, chat_id))
+        self.db.commit()
 
-        if not row:
+        if result.rowcount == 0:
             raise ValueError("Chat not found")
 
-        # Parse existing documents
-        current_docs = json.loads(row[0] or '[]')
-
-        # Filter out the document to unlink
-        updated_docs = [doc for doc in current_docs if doc['document_id'] != doc_id]
-
-        # Update the chat
-        self.db.execute("""
-            UPDATE chats SET documents = ? WHERE id = ?
-        """, (json.dumps(updated_docs), chat_id))
-        self.db.commit()
-
         return True
 
     def get_chat_documents(self, chat_id: str) -> List[Dict[str, Any]]:
@@ -218,39 +248,20 @@ class ChatRepository(BaseRepository):
         Raises:
             ValueError: If chat not found
         """
-        # Get the chat's documents array
-        row = self.db.fetchone("""
-            SELECT documents FROM chats WHERE id = ?
+        # One pass in SQLite: expand the array, join the documents and sort.
+        # The LEFT JOINs keep a single all-NULL row for a chat without
+        # documents, so no rows at all means the chat doesn't exist.
+        rows = self.db.fetchall("""
+            SELECT d.*, json_extract(je.value, '$.created_at') AS added_at
+            FROM chats c
+            LEFT JOIN json_each(COALESCE(c.documents, '[]')) je
+            LEFT JOIN documents d ON d.id = json_extract(je.value, '$.document_id')
+            WHERE c.id = ?
+            ORDER BY added_at DESC
         """, (chat_id,))
 
-        if not row:
+        if not rows:
             raise ValueError("Chat not found")
 
-        # Parse the documents array
-        docs_array = json.loads(row[0] or '[]')
-
-        if not docs_array:
-            return []
-
-        # Extract document IDs and create a mapping for created_at
-        doc_ids = [doc['document_id'] for doc in docs_array]
-        created_at_map = {doc['document_id']: doc['created_at'] for doc in docs_array}
-
-        # Fetch document details
-        placeholders = ','.join('?' * len(doc_ids))
-        rows = self.db.fetchall(f"""
-            SELECT * FROM documents
-            WHERE id IN ({placeholders})
-        """, doc_ids)
-
-        documents = []
-        for row in rows:
-            doc = dict(row)
-            # Add the created_at from the JSONB array (renamed to added_at for compatibility)
-            doc['added_at'] = created_at_map.get(doc['id'])
-            documents.append(doc)
-
-        # Sort by added_at descending
-        documents.sort(key=lambda d: d.get('added_at', ''), reverse=True)
-
-        return documents
+        # Links to deleted documents (and the empty-chat row) have no match
+        return [row for row in rows if row["id"] is not None]
@@ -4,6 +4,7 @@ Chat service with RAG functionality.
 Handles chat operations and RAG-based response generation.
 """
 import json
+import re
 from typing import List, Dict, Optional, Tuple
 from .chats_model import ChatRepository, ChatResponse, ChatWithMessages
 from modules.messages.messages_model import MessageRepository
@@ -11,6 +12,10 @@ from modules.search.search_service import SearchService
 from core.ollama_client import OllamaClient
 from core.config import get_settings
 
+# Token patterns for calculate_chunk_quality_score, compiled once
+_NUMBER_RE = re.compile(r'\b\d+\.?\d*\b')
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
 
 class ChatService:
     """Service for chat operations with RAG support."""
@@ -39,17 +44,8 @@ class ChatService:
         Returns:
             Chat ID
         """
-        chat_id = self.chat_repo.create(title)
-
-        # Link documents if provided
-        if doc_ids:
-            for doc_id in doc_ids:
-                try:
-                    self.chat_repo.link_document(chat_id, doc_id)
-                except Exception as e:
-                    print(f"Warning: Failed to link document {doc_id}: {e}")
-
-        return chat_id
+        # Documents are linked by the same INSERT that creates the chat
+        return self.chat_repo.create(title, doc_ids)
 
     def get_chat(self, chat_id: str) -> Optional[ChatWithMessages]:
         """Get chat by ID with its messages."""
@@ -59,12 +55,14 @@ class ChatService:
 
         messages = self.message_repo.get_by_chat_id(chat_id)
 
-        return ChatWithMessages(**chat, messages=messages)
+        # Rows come from our own schema, so validation is skipped
+        return ChatWithMessages.model_construct(**chat, messages=messages)
 
     def get_all_chats(self) -> List[ChatResponse]:
         """Get all chats."""
         chats = self.chat_repo.get_all()
-        return [ChatResponse(**chat) for chat in chats]
+        # Rows come from our own schema, so per-field validation is skipped
+        return [ChatResponse.model_construct(**chat) for chat in chats]
 
     def delete_chat(self, chat_id: str) -> bool:
         """Delete chat and all its messages."""
@@ -143,9 +141,8 @@ class ChatService:
             score -= min(0.3, bracket_density * 0.5)
 
         # Penalty 3: Number-heavy content
-        import re
-        numbers = re.findall(r'\b\d+\.?\d*\b', text)
-        words = re.findall(r'\b[a-zA-Z]+\b', text)
+        numbers = _NUMBER_RE.findall(text)
+        words = _WORD_RE.findall(text)
         if len(words) > 0:
             number_ratio = len(numbers) / (len(words) + len(numbers))
             if number_ratio > 0.3:  # More than 30% numbers
@@ -218,7 +215,9 @@ class ChatService:
                 query=query,
                 top_k=10,  # Retrieve more candidates
                 threshold=adaptive_threshold,  # Adaptive threshold based on query length
-                doc_ids=doc_ids
+                doc_ids=doc_ids,
+                # Answers must cite this question's own sources
+                use_semantic_cache=False
             )
         except Exception as e:
             print(f"Error during RAG search: {e}")
@@ -434,18 +433,16 @@ Please answer based on the context provided above."""
                     "error": "Failed to generate response from Ollama"
                 }
 
-            # Save user message
-            self.message_repo.create(chat_id, "user", user_message)
-
-            # Save assistant response with sources
-            self.message_repo.create(chat_id, "assistant", response, sources, model)
-
             # If this is the first message, use it as the chat title (truncated)
+            title = None
             if len(conversation_history) == 0 and self.settings.chat_title_generation:
                 title = user_message.strip()
                 if len(title) > 50:
                     title = title[:47] + '...'
-                self.chat_repo.update_title(chat_id, title)
+
+            # Save user message and assistant response with sources (and
+            # the title) in one transaction
+            self.message_repo.create_exchange(chat_id, user_message, response, sources, model, title)
 
             return {
                 "success": True,
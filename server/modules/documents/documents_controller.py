@@ -3,42 +3,27 @@ Document API controller.
 
 FastAPI routes for document management.
 """
+import asyncio
 import json
+import time
+from asyncio import Queue
+from pathlib import Path
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
 from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from typing import List
 from .documents_model import DocumentRepository, DocumentResponse
 from .documents_service import DocumentService
-from .documents_processor import FileProcessor
-from core.dependencies import get_db, get_ollama, get_faiss
-from core.database import DatabaseConnection
-from core.ollama_client import OllamaClient
-from core.faiss_manager import FaissIndexManager
+from core.dependencies import get_document_repository, get_document_service
 
 
 router = APIRouter(prefix="/api/documents", tags=["documents"])
 
-
-def get_document_repository(
-    db: DatabaseConnection = Depends(get_db),
-    faiss_manager: FaissIndexManager = Depends(get_faiss)
-) -> DocumentRepository:
-    """Dependency that provides document repository."""
-    return DocumentRepository(db, faiss_manager)
-
-
-def get_file_processor() -> FileProcessor:
-    """Dependency that provides file processor."""
-    return FileProcessor()
-
-
-def get_document_service(
-    doc_repo: DocumentRepository = Depends(get_document_repository),
-    ollama: OllamaClient = Depends(get_ollama),
-    processor: FileProcessor = Depends(get_file_processor)
-) -> DocumentService:
-    """Dependency that provides document service."""
-    return DocumentService(doc_repo, ollama, processor)
+# Minimum seconds between SSE progress events of the same phase
+PROGRESS_INTERVAL = 0.5
+TERMINAL_PHASES = ("complete", "error")
+# Progress events buffered before document processing waits for the client
+PROGRESS_QUEUE_SIZE = 64
 
 
 @router.post("/process", response_model=dict)
@@ -73,14 +58,12 @@ async def process_document_stream(
     Extracts text, creates chunks, and stores in database while reporting progress.
     """
 
-    # Read file contents before creating generator (while file is still open)
-    file_contents = await file.read()
+    # Stage the upload before creating generator (while file is still open)
+    temp_path, content = await service.stage_upload(file)
     filename = file.filename
 
     async def generate_progress_events():
         """Generator that yields Server-Sent Events for progress updates in real-time."""
-        import asyncio
-        from asyncio import Queue
 
         def format_event(phase: str, progress: int, message: str, details: dict = None):
             """Format progress data as SSE event."""
@@ -94,28 +77,53 @@ async def process_document_stream(
             return f"data: {json.dumps(event_data)}\n\n"
 
         try:
-            # Create queue for real-time progress events
-            queue = Queue()
+            # Bounded, so a slow or departed client can't build up an
+            # unbounded backlog of events
+            queue = Queue(maxsize=PROGRESS_QUEUE_SIZE)
 
             async def capture_progress(phase, progress, message, details=None):
-                """Callback that queues progress events."""
-                await queue.put((phase, progress, message, details))
+                """Callback that queues progress events, never blocking processing."""
+                # Progress is cumulative, so the oldest event is the one to
+                # drop; the final complete/error event is always the newest
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait((phase, progress, message, details))
 
             # Start document processing in background task
             task = asyncio.create_task(
-                service.process_document_stream_bytes(file_contents, filename, progress_callback=capture_progress)
+                service.process_document_stream_file(
+                    temp_path, filename, progress_callback=capture_progress, content=content
+                )
             )
 
-            # Yield progress events in real-time as they arrive
+            # Yield progress events as they arrive, at most one per
+            # PROGRESS_INTERVAL within a phase; phase changes and terminal
+            # events go out immediately and the latest skipped one later
+            last_phase = None
+            last_emit = 0.0
+            pending = None
+
             while not task.done() or not queue.empty():
                 try:
                     # Wait for next event with short timeout
-                    phase, progress, message, details = await asyncio.wait_for(queue.get(), timeout=0.1)
-                    yield format_event(phase, progress, message, details)
+                    event = await asyncio.wait_for(queue.get(), timeout=0.1)
                 except asyncio.TimeoutError:
-                    # No event yet, check if task is done
+                    # No event yet; flush a held-back one once it is due
+                    event, pending = pending, None
+                    if event is None:
+                        continue
+
+                phase = event[0]
+                now = time.monotonic()
+                if (phase == last_phase and phase not in TERMINAL_PHASES
+                        and now - last_emit < PROGRESS_INTERVAL):
+                    pending = event
                     continue
 
+                pending = None
+                last_phase, last_emit = phase, now
+                yield format_event(*event)
+
             # Ensure task completes and raise any exceptions
             await task
 
@@ -131,8 +139,13 @@ async def process_document_stream(
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no"
-        }
+            "X-Accel-Buffering": "no",
+            # GZipMiddleware holds output until its buffer fills, which would
+            # stall progress events; a preset encoding makes it pass through
+            "Content-Encoding": "identity"
+        },
+        # Removes the temp file if the client left before processing ran
+        background=BackgroundTask(Path(temp_path).unlink, missing_ok=True) if temp_path else None
     )
 
 
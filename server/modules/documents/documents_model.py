@@ -4,11 +4,12 @@ Document models and repository.
 Defines Pydantic schemas for API validation and database repository for document operations.
 """
 import uuid
-import json
+import numpy as np
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 from core.database import BaseRepository, DatabaseConnection
+from core.embedding_codec import encode_embedding
 
 
 # ============ Pydantic Schemas ============
@@ -101,7 +102,7 @@ class DocumentRepository(BaseRepository):
             SELECT * FROM documents WHERE id = ?
         """, (doc_id,))
 
-        return self._dict_from_row(row)
+        return row
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all documents ordered by upload date."""
@@ -109,7 +110,7 @@ class DocumentRepository(BaseRepository):
             SELECT * FROM documents ORDER BY upload_date DESC
         """)
 
-        return self._dicts_from_rows(rows)
+        return rows
 
     def delete(self, doc_id: str) -> bool:
         """
@@ -133,11 +134,14 @@ class DocumentRepository(BaseRepository):
             if vector_ids and self.faiss_manager:
                 try:
                     self.faiss_manager.remove_vectors(vector_ids)
-                    self.faiss_manager.save()
+                    if self.faiss_manager.should_save():
+                        self.faiss_manager.save()
                 except Exception as e:
                     print(f"Warning: Could not remove vectors from FAISS index: {e}")
 
-            # Delete document (vectors cascade delete)
+            # Connections don't enable foreign_keys, so the ON DELETE CASCADE
+            # never fires; vectors are deleted explicitly
+            self.db.execute("DELETE FROM vectors WHERE doc_id = ?", (doc_id,))
             result = self.db.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
             self.db.commit()
             return result.rowcount > 0
@@ -168,36 +172,37 @@ class DocumentRepository(BaseRepository):
             Exception: If adding vectors fails
         """
         try:
-            count = 0
-            vector_ids = []
-            embeddings = []
-
-            for chunk in chunks:
-                vector_id = str(uuid.uuid4())
-                embedding_blob = None
-                if chunk.get("embedding"):
-                    embedding_blob = json.dumps(chunk["embedding"]).encode()
-
-                # Insert into vectors table
-                self.db.execute("""
-                    INSERT INTO vectors (id, doc_id, chunk_index, chunk_text, embedding)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (vector_id, doc_id, chunk["index"], chunk["text"], embedding_blob))
-
-                # Collect for FAISS indexing
-                if chunk.get("embedding"):
-                    vector_ids.append(vector_id)
-                    embeddings.append(chunk["embedding"])
-
-                count += 1
-
-            self.db.commit()
+            ids = [str(uuid.uuid4()) for _ in chunks]
+            embedded = [
+                i for i, chunk in enumerate(chunks)
+                if chunk.get("embedding") is not None and len(chunk["embedding"]) > 0
+            ]
+
+            # One contiguous float32 matrix for every embedding in the batch:
+            # rows are serialized straight from it and FAISS adds it in one call
+            embeddings = np.asarray([chunks[i]["embedding"] for i in embedded], dtype=np.float32)
+            blobs = [None] * len(chunks)
+            for i, vector in zip(embedded, embeddings):
+                blobs[i] = encode_embedding(vector)
+
+            rows = [
+                (vector_id, doc_id, chunk["index"], chunk["text"], blob)
+                for vector_id, chunk, blob in zip(ids, chunks, blobs)
+            ]
+            vector_ids = [ids[i] for i in embedded]
+
+            # Insert into vectors table in one transaction
+            count = self.bulk_insert("""
+                INSERT INTO vectors (id, doc_id, chunk_index, chunk_text, embedding)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
 
             # Add to FAISS index
-            if vector_ids and embeddings and self.faiss_manager:
+            if vector_ids and self.faiss_manager:
                 try:
                     self.faiss_manager.add_vectors(vector_ids, embeddings)
-                    self.faiss_manager.save()
+                    if self.faiss_manager.should_save():
+                        self.faiss_manager.save()
                     print(f"Added {len(vector_ids)} vectors to FAISS index")
                 except Exception as e:
                     print(f"Warning: Could not add vectors to FAISS index: {e}")
@@ -217,7 +222,7 @@ class DocumentRepository(BaseRepository):
             ORDER BY chunk_index ASC
         """, (doc_id,))
 
-        return self._dicts_from_rows(rows)
+        return rows
 
     def get_vector_by_id(self, vector_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific vector by ID."""
@@ -227,7 +232,7 @@ class DocumentRepository(BaseRepository):
             WHERE id = ?
         """, (vector_id,))
 
-        return self._dict_from_row(row)
+        return row
 
     def get_stats(self) -> Dict[str, int]:
         """Get document and vector statistics."""
@@ -5,7 +5,7 @@ Handles PDF and TXT file processing with intelligent markdown-based chunking.
 """
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Union
 import pymupdf4llm
 import tiktoken
 from langchain_text_splitters import (
@@ -53,31 +53,42 @@ class FileProcessor:
             if not path.exists():
                 return {"valid": False, "error": "File does not exist"}
 
-            file_size = path.stat().st_size
+            return self.validate_upload(path.name, path.stat().st_size)
 
-            if file_size > self.max_file_size:
-                size_mb = file_size / (1024 * 1024)
-                max_mb = self.max_file_size / (1024 * 1024)
-                return {
-                    "valid": False,
-                    "error": f"File too large: {size_mb:.2f}MB (max {max_mb:.0f}MB)"
-                }
+        except Exception as e:
+            return {"valid": False, "error": str(e)}
 
-            ext = path.suffix.lower()
-            if ext not in ['.pdf', '.txt']:
-                return {
-                    "valid": False,
-                    "error": f"Unsupported file type: {ext}. Only PDF and TXT files are supported."
-                }
+    def validate_upload(self, filename: str, file_size: int) -> Dict:
+        """
+        Validate size and type of a file that may only exist in memory.
 
+        Args:
+            filename: File name (for the extension)
+            file_size: Size in bytes
+
+        Returns:
+            Dict with validation results
+        """
+        if file_size > self.max_file_size:
+            size_mb = file_size / (1024 * 1024)
+            max_mb = self.max_file_size / (1024 * 1024)
             return {
-                "valid": True,
-                "size": file_size,
-                "type": ext
+                "valid": False,
+                "error": f"File too large: {size_mb:.2f}MB (max {max_mb:.0f}MB)"
             }
 
-        except Exception as e:
-            return {"valid": False, "error": str(e)}
+        ext = Path(filename).suffix.lower()
+        if ext not in ['.pdf', '.txt']:
+            return {
+                "valid": False,
+                "error": f"Unsupported file type: {ext}. Only PDF and TXT files are supported."
+            }
+
+        return {
+            "valid": True,
+            "size": file_size,
+            "type": ext
+        }
 
     def _count_tokens(self, text: str) -> int:
         """
@@ -399,11 +410,34 @@ class FileProcessor:
         Raises:
             Exception: If text processing fails
         """
-        try:
-            print(f"Processing text file: {Path(file_path).name}")
+        print(f"Processing text file: {Path(file_path).name}")
 
+        try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 text = f.read()
+        except Exception as e:
+            print(f"Text processing error: {e}")
+            raise Exception(f"Failed to process text: {str(e)}")
+
+        return self.process_text_content(text)
+
+    def process_text_content(self, text: Union[str, bytes]) -> Dict:
+        """
+        Create chunks from text already in memory.
+
+        Args:
+            text: Document text (or UTF-8 bytes)
+
+        Returns:
+            Dict with chunks and metadata
+
+        Raises:
+            Exception: If text processing fails
+        """
+        try:
+            if isinstance(text, bytes):
+                # Same newline handling as reading the file in text mode
+                text = text.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
 
             # Use appropriate chunking method
             if self.use_markdown:
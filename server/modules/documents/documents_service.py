@@ -3,16 +3,21 @@ Document service with business logic.
 
 Handles document processing, embedding generation, and storage coordination.
 """
+import shutil
 import tempfile
 import asyncio
+import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from fastapi import UploadFile
 from .documents_model import DocumentRepository, DocumentCreate, DocumentResponse
 from .documents_processor import FileProcessor
 from core.ollama_client import OllamaClient
 from core.database import DatabaseConnection
 
+# Text uploads up to this size are processed in memory without a temp file
+IN_MEMORY_UPLOAD_SIZE = 8 * 1024 * 1024
+
 
 class DocumentService:
     """Service for document operations with dependency injection."""
@@ -27,6 +32,49 @@ class DocumentService:
         self.ollama = ollama_client
         self.processor = file_processor
 
+    async def save_upload(self, file: UploadFile, chunk_size: int = 1024 * 1024) -> str:
+        """
+        Copy an upload to a temp file without holding it in memory.
+
+        Args:
+            file: Uploaded file
+            chunk_size: Bytes copied per read
+
+        Returns:
+            Path of the temp file, keeping the upload's extension
+        """
+        suffix = Path(file.filename).suffix.lower()
+
+        def copy() -> str:
+            # Creating, filling and closing (flushing) the temp file all
+            # block, so the whole copy runs in a worker thread
+            file.file.seek(0)
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, mode='wb') as temp_file:
+                shutil.copyfileobj(file.file, temp_file, chunk_size)
+                return temp_file.name
+
+        return await asyncio.to_thread(copy)
+
+    async def stage_upload(self, file: UploadFile) -> Tuple[Optional[str], Optional[bytes]]:
+        """
+        Hold a small text upload in memory, or copy anything else to disk.
+
+        Text files up to IN_MEMORY_UPLOAD_SIZE are chunked straight from
+        memory, so the common small-document case skips the temp file.
+        PDFs always go to disk since the PDF parser reads from a path.
+
+        Args:
+            file: Uploaded file
+
+        Returns:
+            Tuple of (temp file path, None) or (None, file contents)
+        """
+        if (Path(file.filename).suffix.lower() == '.txt'
+                and file.size is not None and file.size <= IN_MEMORY_UPLOAD_SIZE):
+            await file.seek(0)
+            return None, await file.read()
+        return await self.save_upload(file), None
+
     async def process_document(
         self,
         file: UploadFile,
@@ -50,41 +98,24 @@ class DocumentService:
         if file_ext not in ['.pdf', '.txt']:
             raise ValueError(f"Unsupported file type: {file_ext}. Only PDF and TXT files are supported.")
 
-        # Read file contents asynchronously
-        file_contents = await file.read()
-
-        # Create temp file and write contents
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext, mode='wb') as temp_file:
-            temp_path = temp_file.name
-            temp_file.write(file_contents)
-            temp_file.flush()  # Ensure buffer is written to disk
+        # Stream the upload to a temp file in chunks
+        temp_path = await self.save_upload(file)
 
+        doc_id = None
         try:
             # Validate file
-            validation = self.processor.validate_file(temp_path)
+            validation = await asyncio.to_thread(self.processor.validate_file, temp_path)
             if not validation["valid"]:
                 raise ValueError(validation["error"])
 
-            # Process file based on type
+            # Parse in a worker thread so the event loop stays responsive
             if file_ext == '.pdf':
-                result = self.processor.process_pdf_streaming(temp_path)
+                result = await asyncio.to_thread(self.processor.process_pdf_streaming, temp_path)
             elif file_ext == '.txt':
-                result = self.processor.process_text(temp_path)
+                result = await asyncio.to_thread(self.processor.process_text, temp_path)
             else:
                 raise ValueError("Unsupported file type")
 
-            # Generate embeddings if requested
-            if generate_embeddings:
-                print(f"Generating embeddings for {len(result['chunks'])} chunks...")
-                chunk_texts = [chunk["text"] for chunk in result["chunks"]]
-                embeddings = self.ollama.generate_embeddings_batch(chunk_texts, batch_size=5)
-
-                # Attach embeddings to chunks
-                for i, chunk in enumerate(result["chunks"]):
-                    chunk["embedding"] = embeddings[i] if i < len(embeddings) else []
-
-                print(f"Embeddings generated: {len([e for e in embeddings if e])} successful")
-
             # Save document to database
             document = DocumentCreate(
                 file_name=file.filename,
@@ -94,10 +125,14 @@ class DocumentService:
                 chunk_count=len(result["chunks"])
             )
 
-            doc_id = self.doc_repo.create(document)
+            doc_id = await asyncio.to_thread(self.doc_repo.create, document)
 
-            # Save vectors
-            vector_count = self.doc_repo.add_vectors(doc_id, result["chunks"])
+            # Embed and save vectors, overlapping the two stages
+            if generate_embeddings:
+                print(f"Generating embeddings for {len(result['chunks'])} chunks...")
+                vector_count = await self._embed_and_store(doc_id, result["chunks"])
+            else:
+                vector_count = await asyncio.to_thread(self.doc_repo.add_vectors, doc_id, result["chunks"])
 
             # Update status
             self.doc_repo.update_status(doc_id, "completed")
@@ -116,46 +151,126 @@ class DocumentService:
 
         except Exception as e:
             # Cleanup on error
+            if doc_id:
+                self.doc_repo.update_status(doc_id, "failed")
             Path(temp_path).unlink(missing_ok=True)
             raise e
 
-    async def process_document_stream_bytes(
+    async def _embed_and_store(
+        self,
+        doc_id: str,
+        chunks: List[Dict],
+        batch_size: int = 64,
+        queue_size: int = 2
+    ) -> int:
+        """
+        Embed chunks and store them as a two-stage pipeline.
+
+        One task embeds batch i+1 while the database writer stores batch i;
+        the bounded queue between them caps how far embedding runs ahead.
+
+        Args:
+            doc_id: Document ID the vectors belong to
+            chunks: Chunks with text and index
+            batch_size: Chunks per embed/store batch
+            queue_size: Embedded batches buffered before embedding waits
+
+        Returns:
+            Number of vectors stored
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        # Embedding per distinct text, so text repeated anywhere in the
+        # document (headers, footers, table rows) is only embedded once
+        embedded: Dict[str, Optional[np.ndarray]] = {}
+
+        async def embed():
+            try:
+                for start in range(0, len(chunks), batch_size):
+                    batch = chunks[start:start + batch_size]
+                    new_texts = list(dict.fromkeys(
+                        chunk["text"] for chunk in batch if chunk["text"] not in embedded
+                    ))
+                    if new_texts:
+                        embeddings = await self.ollama.agenerate_embeddings_batch(new_texts)
+                        for text, embedding, ok in zip(new_texts, embeddings, embeddings.any(axis=1)):
+                            embedded[text] = embedding if ok else None
+
+                    # Attach embedding rows to chunks (None where generation failed)
+                    for chunk in batch:
+                        chunk["embedding"] = embedded[chunk["text"]]
+                    await queue.put(batch)
+            except Exception:
+                await queue.put(None)  # Let the writer stop, then re-raise
+                raise
+            await queue.put(None)  # End of stream
+
+        embed_task = asyncio.create_task(embed())
+        count = 0
+        done = False
+        try:
+            while not done:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                # Batches that queued up while the last write ran are stored
+                # together, so a slow disk costs fewer transactions
+                while not queue.empty():
+                    more = queue.get_nowait()
+                    if more is None:
+                        done = True
+                        break
+                    batch = batch + more
+
+                # The SQLite insert and FAISS add run off the event loop
+                count += await asyncio.to_thread(self.doc_repo.add_vectors, doc_id, batch)
+        finally:
+            if not embed_task.done():
+                embed_task.cancel()
+
+        # Surface embedding errors after the writer drained the queue
+        await embed_task
+
+        succeeded = sum(1 for chunk in chunks if chunk.get("embedding") is not None)
+        print(f"Embeddings generated: {succeeded} successful")
+        return count
+
+    async def process_document_stream_file(
         self,
-        file_contents: bytes,
+        temp_path: Optional[str],
         filename: str,
-        progress_callback=None
+        progress_callback=None,
+        content: Optional[bytes] = None
     ):
         """
-        Process document from bytes with streaming progress updates.
+        Process an upload staged by stage_upload with streaming progress updates.
+
+        The temp file, if any, is deleted when processing finishes.
 
         Args:
-            file_contents: File contents as bytes
+            temp_path: Temp file written by save_upload, or None with content
             filename: Original filename
             progress_callback: Async callback for progress updates
+            content: Contents of a text upload held in memory
 
         Yields:
             Progress update dictionaries
         """
         file_ext = Path(filename).suffix.lower()
 
-        temp_path = None
-
         try:
             # Upload phase (5%)
             if progress_callback:
                 await progress_callback("upload", 5, f"Uploading {filename}...")
 
-            # Create temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext, mode='wb') as temp_file:
-                temp_path = temp_file.name
-                temp_file.write(file_contents)
-                temp_file.flush()  # Ensure buffer is written to disk
-
             # Validation phase (10%)
             if progress_callback:
                 await progress_callback("validation", 10, "Validating file...")
 
-            validation = self.processor.validate_file(temp_path)
+            if content is not None:
+                validation = self.processor.validate_upload(filename, len(content))
+            else:
+                validation = await asyncio.to_thread(self.processor.validate_file, temp_path)
             if not validation["valid"]:
                 raise ValueError(validation["error"])
 
@@ -163,10 +278,12 @@ class DocumentService:
             if progress_callback:
                 await progress_callback("extraction", 15, f"Extracting text from {file_ext.upper()}...")
 
-            if file_ext == '.pdf':
-                result = self.processor.process_pdf_streaming(temp_path)
+            if content is not None:
+                result = await asyncio.to_thread(self.processor.process_text_content, content)
+            elif file_ext == '.pdf':
+                result = await asyncio.to_thread(self.processor.process_pdf_streaming, temp_path)
             elif file_ext == '.txt':
-                result = self.processor.process_text(temp_path)
+                result = await asyncio.to_thread(self.processor.process_text, temp_path)
             else:
                 raise ValueError("Unsupported file type")
 
@@ -179,36 +296,40 @@ class DocumentService:
             if progress_callback:
                 await progress_callback("embedding", 30, f"Generating embeddings for {chunk_count} chunks...")
 
-            chunk_texts = [chunk["text"] for chunk in result["chunks"]]
+            # Embed each distinct text once, shortest first so rounds hold
+            # similar lengths, and fan results back out below
+            chunk_texts = sorted(dict.fromkeys(chunk["text"] for chunk in result["chunks"]), key=len)
+            unique_count = len(chunk_texts)
             embeddings = []
-            batch_size = 5
+            # One progress step per round of concurrent /api/embed batch
+            # requests (request size is tuned by the client)
+            batch_size = 16 * self.ollama.concurrency
 
-            for i in range(0, chunk_count, batch_size):
+            for i in range(0, unique_count, batch_size):
                 batch = chunk_texts[i:i + batch_size]
                 batch_num = i // batch_size + 1
-                total_batches = (chunk_count + batch_size - 1) // batch_size
+                total_batches = (unique_count + batch_size - 1) // batch_size
+
+                # Failed rows come back all zero
+                matrix = await self.ollama.agenerate_embeddings_batch(batch)
+                for row in matrix:
+                    embeddings.append(row if row.any() else None)
 
-                progress = 30 + int((i / chunk_count) * 55)
+                # Report each round once its requests have all completed
+                progress = 30 + int((len(embeddings) / unique_count) * 55)
                 if progress_callback:
                     await progress_callback("embedding", progress,
-                                          f"Processing batch {batch_num}/{total_batches}",
+                                          f"Embedded batch {batch_num}/{total_batches}",
                                           {"batch": batch_num, "totalBatches": total_batches})
 
-                for text in batch:
-                    try:
-                        embedding = self.ollama.generate_embedding(text)
-                        embeddings.append(embedding)
-                        await asyncio.sleep(0.1)
-                    except Exception as e:
-                        print(f"Error generating embedding: {e}")
-                        embeddings.append([])
-
-            # Attach embeddings
-            for i, chunk in enumerate(result["chunks"]):
-                chunk["embedding"] = embeddings[i] if i < len(embeddings) else []
+            # Attach embeddings (None where generation failed)
+            embedded = dict(zip(chunk_texts, embeddings))
+            for chunk in result["chunks"]:
+                chunk["embedding"] = embedded.get(chunk["text"])
 
             if progress_callback:
-                await progress_callback("embedding", 85, f"Generated {len([e for e in embeddings if e])} embeddings")
+                await progress_callback("embedding", 85,
+                                        f"Generated {sum(1 for e in embeddings if e is not None)} embeddings")
 
             # Storage phase (85-95%)
             if progress_callback:
@@ -222,12 +343,12 @@ class DocumentService:
                 chunk_count=chunk_count
             )
 
-            doc_id = self.doc_repo.create(document)
+            doc_id = await asyncio.to_thread(self.doc_repo.create, document)
 
             if progress_callback:
                 await progress_callback("storage", 90, "Saving chunks and vectors...")
 
-            self.doc_repo.add_vectors(doc_id, result["chunks"])
+            await asyncio.to_thread(self.doc_repo.add_vectors, doc_id, result["chunks"])
             self.doc_repo.update_status(doc_id, "completed")
 
             # Complete (100%)
@@ -5,7 +5,7 @@ Defines Pydantic schemas for message API and database repository for message ope
 """
 import uuid
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 from core.database import BaseRepository, DatabaseConnection
 
@@ -86,6 +86,63 @@ class MessageRepository(BaseRepository):
 
         return message_id
 
+    def create_exchange(
+        self,
+        chat_id: str,
+        user_message: str,
+        response: str,
+        sources: Optional[List[Dict]] = None,
+        model_used: Optional[str] = None,
+        title: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Store a user message and its assistant response in one transaction.
+
+        The chat's updated_at (and title, if given) is updated in the same
+        transaction, so the whole exchange costs a single commit.
+
+        Args:
+            chat_id: Chat ID
+            user_message: User message content
+            response: Assistant response content
+            sources: Optional list of source documents for the response
+            model_used: Optional model name used for generation
+            title: Optional new chat title
+
+        Returns:
+            Tuple of (user message ID, assistant message ID)
+
+        Raises:
+            Exception: If storing the messages fails (nothing is stored)
+        """
+        user_id = str(uuid.uuid4())
+        assistant_id = str(uuid.uuid4())
+        sources_json = json.dumps(sources) if sources else None
+
+        try:
+            if not self.db.conn.in_transaction:
+                self.db.execute("BEGIN IMMEDIATE")
+            self.db.executemany("""
+                INSERT INTO messages (id, chat_id, role, content, sources, model_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (user_id, chat_id, "user", user_message, None, None),
+                (assistant_id, chat_id, "assistant", response, sources_json, model_used)
+            ])
+
+            # Update chat's updated_at timestamp (and title)
+            self.db.execute("""
+                UPDATE chats SET updated_at = CURRENT_TIMESTAMP, title = COALESCE(?, title)
+                WHERE id = ?
+            """, (title, chat_id))
+
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return user_id, assistant_id
+
     def get_by_chat_id(self, chat_id: str) -> List[Dict[str, Any]]:
         """
         Get all messages for a chat.
@@ -102,7 +159,7 @@ class MessageRepository(BaseRepository):
             ORDER BY created_at ASC
         """, (chat_id,))
 
-        messages = self._dicts_from_rows(rows)
+        messages = rows
 
         # Parse sources JSON for each message
         for msg in messages:
@@ -123,7 +180,7 @@ class MessageRepository(BaseRepository):
         if not row:
             return None
 
-        msg = self._dict_from_row(row)
+        msg = row
 
         # Parse sources JSON
         if msg.get("sources"):
@@ -6,18 +6,12 @@ FastAPI routes for Ollama integration.
 from fastapi import APIRouter, HTTPException, Depends, Query
 from .ollama_model import OllamaStatusResponse, ModelSearchResponse, CategoryResponse, ChatModelsResponse
 from .ollama_service import OllamaService
-from core.dependencies import get_ollama
-from core.ollama_client import OllamaClient
+from core.dependencies import get_ollama_service
 
 
 router = APIRouter(prefix="/api/ollama", tags=["ollama"])
 
 
-def get_ollama_service(ollama: OllamaClient = Depends(get_ollama)) -> OllamaService:
-    """Dependency that provides Ollama service."""
-    return OllamaService(ollama)
-
-
 @router.get("/status", response_model=OllamaStatusResponse)
 async def get_ollama_status(service: OllamaService = Depends(get_ollama_service)):
     """Check Ollama installation and running status."""
@@ -6,7 +6,7 @@ Scrapes and caches model information from ollama.com/library
 
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
@@ -18,10 +18,15 @@ class OllamaLibraryScraper:
 
     LIBRARY_URL = "https://ollama.com/library"
     CACHE_TTL_HOURS = 24
+    SEARCH_CACHE_SIZE = 256
 
     def __init__(self):
         self._cache: Optional[List[Dict]] = None
         self._cache_time: Optional[datetime] = None
+        # Lowercased text matched by search, one entry per cached model
+        self._search_text: List[str] = []
+        # Results per (query, category), valid until the models are refreshed
+        self._search_cache: Dict[Tuple[str, Optional[str]], List[Dict]] = {}
 
     def _is_cache_valid(self) -> bool:
         """Check if cached data is still valid"""
@@ -208,6 +213,13 @@ class OllamaLibraryScraper:
             self._cache = self._scrape_library()
             self._cache_time = datetime.now()
 
+            # Search name, display_name, description, and tags
+            self._search_text = [
+                ' '.join([model['name'], model['display_name'], model['description'], *model['tags']]).lower()
+                for model in self._cache
+            ]
+            self._search_cache = {}
+
         return self._cache or []
 
     def search_models(self, query: str, category: Optional[str] = None) -> List[Dict]:
@@ -217,28 +229,28 @@ class OllamaLibraryScraper:
         if not query and not category:
             return models
 
-        results = []
         query_lower = query.lower() if query else ''
+        key = (query_lower, category)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
 
-        for model in models:
+        results = []
+        for model, searchable_text in zip(models, self._search_text):
             # Filter by category if specified
             if category and model['category'] != category:
                 continue
 
-            # Search in name, display_name, description, and tags
-            if query_lower:
-                searchable_text = (
-                    model['name'].lower() + ' ' +
-                    model['display_name'].lower() + ' ' +
-                    model['description'].lower() + ' ' +
-                    ' '.join(model['tags']).lower()
-                )
-
-                if query_lower not in searchable_text:
-                    continue
+            if query_lower and query_lower not in searchable_text:
+                continue
 
             results.append(model)
 
+        # Drop the oldest query once full (dicts keep insertion order)
+        if len(self._search_cache) >= self.SEARCH_CACHE_SIZE:
+            self._search_cache.pop(next(iter(self._search_cache)))
+        self._search_cache[key] = results
+
         return results
 
     def get_categories(self) -> List[str]:
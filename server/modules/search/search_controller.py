@@ -3,33 +3,17 @@ Search API controller.
 
 FastAPI routes for semantic vector search.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Optional
-from .search_model import VectorRepository, SearchResponse
+from .search_model import SearchResponse
 from .search_service import SearchService
-from core.dependencies import get_db, get_ollama, get_faiss
-from core.database import DatabaseConnection
-from core.ollama_client import OllamaClient
-from core.faiss_manager import FaissIndexManager
+from core.dependencies import get_search_service
 
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
 
-def get_vector_repository(db: DatabaseConnection = Depends(get_db)) -> VectorRepository:
-    """Dependency that provides vector repository."""
-    return VectorRepository(db)
-
-
-def get_search_service(
-    vector_repo: VectorRepository = Depends(get_vector_repository),
-    ollama: OllamaClient = Depends(get_ollama),
-    faiss_manager: FaissIndexManager = Depends(get_faiss)
-) -> SearchService:
-    """Dependency that provides search service."""
-    return SearchService(vector_repo, ollama, faiss_manager)
-
-
 @router.get("", response_model=SearchResponse)
 async def search_vectors(
     query: str = Query(..., description="Search query text"),
@@ -49,7 +33,10 @@ async def search_vectors(
         if doc_ids:
             parsed_doc_ids = [id.strip() for id in doc_ids.split(',') if id.strip()]
 
-        result = service.search(
+        # Embedding the query and scanning the index block, so they run
+        # in a worker thread while the event loop keeps serving requests
+        result = await asyncio.to_thread(
+            service.search,
             query=query.strip(),
             top_k=top_k,
             threshold=threshold,
@@ -3,12 +3,11 @@ Search models and repository.
 
 Defines Pydantic schemas for search API and vector repository.
 """
-import json
-import math
 import numpy as np
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from core.database import BaseRepository, DatabaseConnection
+from core.embedding_codec import decode_embedding
 
 
 # ============ Pydantic Schemas ============
@@ -96,9 +95,9 @@ class VectorRepository(BaseRepository):
             """
             rows = self.db.fetchall(query)
 
-        return self._dicts_from_rows(rows)
+        return rows
 
-    def decode_embedding(self, embedding_blob: bytes) -> Optional[List[float]]:
+    def decode_embedding(self, embedding_blob: bytes) -> Optional[np.ndarray]:
         """
         Decode embedding from BLOB storage.
 
@@ -106,19 +105,19 @@ class VectorRepository(BaseRepository):
             embedding_blob: Binary embedding data
 
         Returns:
-            List of floats or None if decoding fails
+            Float32 array or None if decoding fails
         """
         if not embedding_blob:
             return None
 
         try:
-            return json.loads(embedding_blob.decode('utf-8'))
+            return decode_embedding(embedding_blob)
         except Exception as e:
             print(f"Error decoding embedding: {e}")
             return None
 
     @staticmethod
-    def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+    def cosine_similarity(vec1, vec2) -> float:
         """
         Calculate cosine similarity between two vectors.
 
@@ -129,23 +128,33 @@ class VectorRepository(BaseRepository):
         Returns:
             Similarity score between 0 and 1 (1 = identical, 0 = orthogonal)
         """
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
+        if len(vec1) == 0 or len(vec2) == 0 or len(vec1) != len(vec2):
             return 0.0
+        return float(VectorRepository.cosine_similarities(vec1, [vec2])[0])
 
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    @staticmethod
+    def cosine_similarities(query, vectors: List[np.ndarray]) -> np.ndarray:
+        """
+        Calculate cosine similarity between a query and many vectors at once.
 
-        # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(b * b for b in vec2))
+        Args:
+            query: Query vector of length d
+            vectors: Stored vectors, each of length d
 
-        # Avoid division by zero
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
+        Returns:
+            Float32 array of similarity scores clipped to 0-1 (0 for zero vectors)
+        """
+        if not len(vectors):
+            return np.empty(0, dtype=np.float32)
+
+        matrix = np.stack(vectors).astype(np.float32, copy=False)
+        q = np.asarray(query, dtype=np.float32)
 
-        # Cosine similarity = dot product / (magnitude1 * magnitude2)
-        similarity = dot_product / (magnitude1 * magnitude2)
+        # One matrix-vector product instead of a Python loop per vector
+        dots = matrix @ q
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(q)
+        similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
 
         # Normalize to 0-1 range
-        return max(0.0, min(1.0, similarity))
+        return np.clip(similarities, 0.0, 1.0)
 
@@ -8,6 +8,7 @@ from .search_model import VectorRepository, SearchResponse, SearchResultItem
 from core.ollama_client import OllamaClient
 from core.config import get_settings
 from core.faiss_manager import FaissIndexManager
+from core.semantic_cache import get_semantic_cache
 
 
 class SearchService:
@@ -29,7 +30,8 @@ class SearchService:
         query: str,
         top_k: int = None,
         threshold: float = None,
-        doc_ids: Optional[List[str]] = None
+        doc_ids: Optional[List[str]] = None,
+        use_semantic_cache: bool = True
     ) -> SearchResponse:
         """
         Perform semantic search over stored document chunks.
@@ -39,6 +41,8 @@ class SearchService:
             top_k: Number of top results to return
             threshold: Minimum similarity score (0-1)
             doc_ids: Optional list of document IDs to filter by
+            use_semantic_cache: Allow results of a near-duplicate earlier
+                query when the semantic cache is enabled in settings
 
         Returns:
             SearchResponse with results and metadata
@@ -67,9 +71,21 @@ class SearchService:
             print(f"Generating embedding for query: '{query}'")
             query_embedding = self.ollama.generate_embedding(query)
 
-            if not query_embedding:
+            if len(query_embedding) == 0:
                 raise Exception("Failed to generate query embedding")
 
+            # When enabled, near-duplicate queries with the same parameters
+            # reuse results until the index changes
+            semantic_cache = None
+            if use_semantic_cache and self.settings.semantic_cache_size > 0:
+                semantic_cache = get_semantic_cache()
+                cache_key = (top_k, threshold, tuple(sorted(doc_ids)) if doc_ids else None)
+                index_version = self.faiss_manager.version
+                cached = semantic_cache.lookup(query_embedding, cache_key, index_version)
+                if cached is not None:
+                    print(f"Semantic cache hit for query: '{query}'")
+                    return cached.model_copy(update={"query": query})
+
             # Initialize tracking variables
             total_searched = 0
             filtered_results = []
@@ -171,18 +187,17 @@ class SearchService:
 
                 total_searched = len(vectors)
 
-                # Calculate similarities with Python
+                # Stack the stored embeddings and score them with one matrix product
+                rows, stored = [], []
                 for row in vectors:
-                    embedding_blob = row.get("embedding")
-                    if not embedding_blob:
-                        continue
-
-                    stored_embedding = self.vector_repo.decode_embedding(embedding_blob)
-                    if not stored_embedding:
-                        continue
+                    stored_embedding = self.vector_repo.decode_embedding(row.get("embedding"))
+                    if stored_embedding is not None and len(stored_embedding) == len(query_embedding):
+                        rows.append(row)
+                        stored.append(stored_embedding)
 
-                    similarity = self.vector_repo.cosine_similarity(query_embedding, stored_embedding)
+                similarities = self.vector_repo.cosine_similarities(query_embedding, stored)
 
+                for row, similarity in zip(rows, similarities.tolist()):
                     if similarity >= threshold:
                         filtered_results.append({
                             "vector_id": row["vector_id"],
@@ -203,7 +218,7 @@ class SearchService:
 
                 print(f"Python fallback complete: {len(filtered_results)} results from {total_searched} vectors")
 
-            return SearchResponse(
+            response = SearchResponse(
                 success=True,
                 results=[SearchResultItem(**r) for r in filtered_results],
                 query=query,
@@ -211,6 +226,9 @@ class SearchService:
                 total_matches=len(filtered_results),
                 returned=len(filtered_results)
             )
+            if semantic_cache is not None:
+                semantic_cache.add(query_embedding, cache_key, response, index_version)
+            return response
 
         except Exception as e:
             print(f"Error during vector search: {e}")